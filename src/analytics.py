@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from data_io import read_dataset
+from feature_engineering_class import FeatureEngineer, PERIOD_COLUMNS
+from instrumentation import span
+
+@dataclass(frozen=True)
+class Grouping:
+    """
+    Declarative description of one way to group colleges for summaries.
+    
+    Attributes:
+        name (str): Name of the grouping, used in the output tables
+        column (str): Column the groups are derived from
+        bins (tuple | int | None): Bin edges, a number of equal-count tiers,
+            or None to group by the column's values
+        labels (tuple | None): Labels for the bins given as edges
+    """
+    name: str
+    column: str
+    bins: tuple | int | None = None
+    labels: tuple | None = None
+
+# Groupings summarized by summarize_all; period columns are added when present
+GROUPINGS = (
+    Grouping("tuition_band", "tuition_cost",
+             bins=(0, 20_000, 40_000, 60_000, np.inf),
+             labels=("Under $20k", "$20k-$40k", "$40k-$60k", "$60k and over")),
+    Grouping("selectivity_tier", "selectivity_score", bins=4),
+)
+
+# Metrics averaged per group, plain and weighted by cohort size
+RATE_METRICS = ("graduate_rate_4yr", "graduate_rate_6yr", "avg_graduation_rate", "graduation_rate_improvement")
+
+# Metrics whose quantiles are reported per group
+QUANTILE_METRICS = ("selectivity_score",)
+
+# Quantiles reported for QUANTILE_METRICS
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Column the weighted means are weighted by
+WEIGHT_COLUMN = "cohort_size"
+
+class CohortAnalyzer:
+    """A class to compute grouped statistics over an engineered college dataset."""
+    
+    def __init__(self, dataset: str | pd.DataFrame | FeatureEngineer):
+        """
+        Initialize the CohortAnalyzer with an engineered dataset.
+        
+        Engineered features the summaries need but the dataset lacks are computed.
+        
+        Args:
+            dataset (str | pd.DataFrame | FeatureEngineer): Path to the engineered
+                dataset file, a dataframe, or a FeatureEngineer whose dataframe
+                should be summarized
+        """
+        if isinstance(dataset, FeatureEngineer):
+            dataset = dataset.get_dataframe()
+        if not isinstance(dataset, pd.DataFrame):
+            dataset = read_dataset(dataset)
+        engineer = FeatureEngineer(dataset, validate=False)
+        missing = [
+            name for name in engineer.feature_specs
+            if name in RATE_METRICS + QUANTILE_METRICS + (WEIGHT_COLUMN,) and name not in dataset.columns
+        ]
+        if missing:
+            engineer.compute_features(missing)
+        self.df = engineer.get_dataframe()
+        self._work = None
+        self.groupings = {grouping.name: grouping for grouping in GROUPINGS}
+        for column in PERIOD_COLUMNS:
+            if column in self.df.columns:
+                self.groupings[column] = Grouping(column, column)
+    
+    def register_grouping(self, grouping: Grouping) -> None:
+        """
+        Add a grouping to the set summarized by summarize_all.
+        
+        Args:
+            grouping (Grouping): Grouping to register; replaces any grouping with the same name
+        """
+        self.groupings[grouping.name] = grouping
+    
+    def group_labels(self, grouping: str | Grouping) -> pd.Series:
+        """
+        Assign every college to its group.
+        
+        Args:
+            grouping (str | Grouping): Registered grouping name or a grouping
+        
+        Returns:
+            pd.Series: Group label per row, aligned with the dataframe
+        """
+        grouping = self.groupings[grouping] if isinstance(grouping, str) else grouping
+        values = self.df[grouping.column]
+        if grouping.bins is None:
+            return values.rename(grouping.name)
+        if isinstance(grouping.bins, int):
+            tiers = pd.qcut(values, grouping.bins, labels=False, duplicates="drop")
+            labels = [f"Q{tier + 1}" for tier in range(int(tiers.max()) + 1)] if tiers.notna().any() else []
+            return pd.Series(
+                pd.Categorical.from_codes(tiers.fillna(-1).astype(int), categories=labels),
+                index=self.df.index,
+                name=grouping.name
+            )
+        return pd.cut(values, bins=list(grouping.bins), labels=grouping.labels, right=False).rename(grouping.name)
+    
+    def _work_frame(self) -> pd.DataFrame:
+        """
+        Build, once, the float frame every summary groups: the rate metrics,
+        their weighted values and weights, and the quantile metrics.
+        
+        Returns:
+            pd.DataFrame: Single-block float64 frame aligned with the dataframe
+        """
+        if self._work is None:
+            rate_metrics = [metric for metric in RATE_METRICS if metric in self.df.columns]
+            quantile_metrics = [metric for metric in QUANTILE_METRICS if metric in self.df.columns]
+            # One row per column, so each column is a contiguous slice written in place
+            count = len(rate_metrics)
+            values = np.empty((3 * count + len(quantile_metrics), len(self.df)))
+            for position, column in enumerate(rate_metrics + quantile_metrics):
+                target = position if position < count else 2 * count + position
+                values[target] = self.df[column].to_numpy(dtype="float64", na_value=np.nan)
+            weights = self.df[WEIGHT_COLUMN].to_numpy(dtype="float64", na_value=np.nan)
+            rates = values[:count]
+            np.multiply(rates, weights, out=values[count:2 * count])
+            # A row's weight only counts toward the metrics it has a value for
+            np.multiply(~np.isnan(rates), weights, out=values[2 * count:3 * count])
+            columns = (
+                rate_metrics
+                + [f"{metric}:weighted" for metric in rate_metrics]
+                + [f"{metric}:weight" for metric in rate_metrics]
+                + quantile_metrics
+            )
+            # One 2-D array keeps a single block, so grouping never consolidates columns
+            self._work = pd.DataFrame(values.T, columns=columns)
+        return self._work
+    
+    def summarize(self, grouping: str | Grouping) -> pd.DataFrame:
+        """
+        Compute every statistic for one grouping from a single group-by.
+        
+        Counts, means and cohort-size weighted means of RATE_METRICS and the
+        QUANTILES of QUANTILE_METRICS all come from the same grouped frame,
+        so the data is factorized into groups once. The frame itself is
+        built on first use and shared by every grouping.
+        
+        Args:
+            grouping (str | Grouping): Registered grouping name or a grouping
+        
+        Returns:
+            pd.DataFrame: Tidy table with one row per grouping, group, metric
+                and statistic ('count', 'mean', 'weighted_mean' or 'q25'-style
+                quantiles), plus the value
+        """
+        grouping = self.groupings[grouping] if isinstance(grouping, str) else grouping
+        rate_metrics = [metric for metric in RATE_METRICS if metric in self.df.columns]
+        quantile_metrics = [metric for metric in QUANTILE_METRICS if metric in self.df.columns]
+        
+        with span("summarize", grouping=grouping.name, rows=len(self.df)):
+            work = self._work_frame()
+            summed_columns = [f"{metric}{suffix}" for suffix in ("", ":weighted", ":weight") for metric in rate_metrics]
+            # Grouping on the labels' array keeps band order and ignores the dataframe's index
+            grouped = work.groupby(self.group_labels(grouping).array, observed=True, sort=True)
+            counts = grouped[rate_metrics].count()
+            sums = grouped[summed_columns].sum()
+            quantiles = grouped[quantile_metrics].quantile(list(QUANTILES))
+        
+        tables = []
+        for metric in rate_metrics:
+            statistics = pd.DataFrame({
+                "count": counts[metric],
+                "mean": sums[metric] / counts[metric].replace(0, np.nan),
+                "weighted_mean": sums[f"{metric}:weighted"] / sums[f"{metric}:weight"].replace(0, np.nan),
+            })
+            tables.append(statistics.assign(metric=metric))
+        for metric in quantile_metrics:
+            statistics = quantiles[metric].unstack()
+            statistics.columns = [f"q{round(q * 100)}" for q in statistics.columns]
+            tables.append(statistics.assign(metric=metric))
+        
+        summary = pd.concat(tables).rename_axis("group").reset_index()
+        summary = summary.melt(id_vars=["group", "metric"], var_name="statistic").dropna(subset=["value"])
+        summary.insert(0, "grouping", grouping.name)
+        return summary.reset_index(drop=True)
+    
+    def summarize_all(self) -> pd.DataFrame:
+        """
+        Summarize every registered grouping whose column is in the dataset.
+        
+        Returns:
+            pd.DataFrame: The tidy tables from summarize, stacked
+        """
+        tables = [
+            self.summarize(grouping) for grouping in self.groupings.values()
+            if grouping.column in self.df.columns
+        ]
+        return pd.concat(tables, ignore_index=True)
+    
+    def rank_table(self, grouping: str | Grouping, metric: str, top: int | None = None) -> pd.DataFrame:
+        """
+        Rank colleges by a metric within each group.
+        
+        Args:
+            grouping (str | Grouping): Registered grouping name or a grouping
+            metric (str): Column to rank by, highest first
+            top (int | None): Keep only this many colleges per group, or None for all
+        
+        Returns:
+            pd.DataFrame: One row per college with its group, metric value and
+                rank (ties share the best rank), sorted by group then rank
+        """
+        grouping = self.groupings[grouping] if isinstance(grouping, str) else grouping
+        labels = self.group_labels(grouping)
+        ranks = self.df[metric].groupby(labels, observed=True).rank(method="min", ascending=False)
+        table = pd.DataFrame({
+            "grouping": grouping.name,
+            "group": labels,
+            "colleges": self.df["colleges"],
+            metric: self.df[metric],
+            "rank": ranks,
+        }).dropna(subset=["group", "rank"])
+        table["rank"] = table["rank"].astype(int)
+        if top is not None:
+            table = table[table["rank"] <= top]
+        return table.sort_values(["group", "rank"], kind="stable").reset_index(drop=True)
+
+if __name__ == "__main__":
+    import sys
+    
+    path = sys.argv[1] if len(sys.argv) > 1 else "datasets/engineered_data.csv"
+    analyzer = CohortAnalyzer(path)
+    print(analyzer.summarize_all().to_string())
@@ -0,0 +1,261 @@
+"""
+Runs feature engineering and visualization over many datasets shaped like
+datasets/dataset.csv, colleges_100.csv or college_data.csv. Each dataset is
+processed in its own worker process and gets its own output directory; a
+failing dataset is reported without stopping the rest of the batch.
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from data_io import read_dataset
+from export_targets import DEFAULT_EXPORTS, EXPORT_TARGETS
+from feature_engineering_class import FeatureEngineer
+from schema import LOSSLESS_DTYPES, apply_schema, normalize_columns
+
+def expand_inputs(patterns: list) -> list:
+    """
+    Expand paths and glob patterns into a sorted list of dataset files.
+    
+    Args:
+        patterns (list): File paths or glob patterns (e.g., 'datasets/*.csv')
+    
+    Returns:
+        list: Matching file paths, each listed once
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(matches)
+    return list(dict.fromkeys(paths))
+
+def output_dirs_for(paths: list, output_root: str) -> dict:
+    """
+    Give every dataset its own output directory, named after the file.
+    
+    Names that collide are made more specific, one step at a time, only for
+    the datasets involved: first the parent directory name is prefixed, then
+    the file extension is appended, and any names still shared get a counter.
+    
+    Args:
+        paths (list): Dataset file paths
+        output_root (str): Directory the per-dataset directories are created in
+    
+    Returns:
+        dict: Dataset path to output directory, each directory distinct
+    """
+    candidates = []
+    for path in paths:
+        stem, extension = os.path.splitext(os.path.basename(path))
+        parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+        candidates.append([stem, f"{parent}_{stem}", f"{parent}_{stem}_{extension.lstrip('.')}".rstrip("_")])
+    
+    levels = [0] * len(paths)
+    names = [options[0] for options in candidates]
+    while True:
+        counts = Counter(names)
+        colliding = [
+            position for position, name in enumerate(names)
+            if counts[name] > 1 and levels[position] < len(candidates[position]) - 1
+        ]
+        if not colliding:
+            break
+        for position in colliding:
+            levels[position] += 1
+            names[position] = candidates[position][levels[position]]
+    
+    # Paths naming the same file in different ways share every candidate
+    taken = set()
+    for position, name in enumerate(names):
+        unique, counter = name, 2
+        while unique in taken:
+            unique, counter = f"{name}_{counter}", counter + 1
+        taken.add(unique)
+        names[position] = unique
+    return {path: os.path.join(output_root, name) for path, name in zip(paths, names)}
+
+def process_dataset(dataset_path: str, output_dir: str, exports: tuple = DEFAULT_EXPORTS) -> dict:
+    """
+    Engineer and visualize one dataset, recording timing and any failure.
+    
+    Column names from variant exports are normalized first. The engineered
+    dataset is saved as engineered_data.csv and the figures go to a
+    figures directory, both inside output_dir. Progress messages are kept out
+    of the batch output.
+    
+    Args:
+        dataset_path (str): Path to the input dataset
+        output_dir (str): Directory for this dataset's outputs
+        exports (tuple): Export tiers each figure is written to
+    
+    Returns:
+        dict: 'dataset', 'output_dir', 'status' ('ok' or 'failed'), 'rows',
+            'validation_problems', per-stage and total 'seconds', and 'error'
+    """
+    result = {
+        "dataset": dataset_path,
+        "output_dir": output_dir,
+        "status": "ok",
+        "rows": None,
+        "validation_problems": None,
+        "seconds": {},
+        "error": None,
+    }
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage_start = time.perf_counter()
+            df = apply_schema(normalize_columns(read_dataset(dataset_path)), LOSSLESS_DTYPES)
+            engineer = FeatureEngineer(df)
+            engineer.engineer_all_features()
+            os.makedirs(output_dir, exist_ok=True)
+            engineer.save_engineered_data(os.path.join(output_dir, "engineered_data.csv"))
+            result["rows"] = len(engineer.df)
+            result["validation_problems"] = len(engineer.validation_report)
+            result["seconds"]["engineer"] = time.perf_counter() - stage_start
+            
+            # Plotting libraries are only loaded once engineering has succeeded
+            import matplotlib
+            matplotlib.use("Agg")
+            from visualization_class import CollegeVisualizer
+            
+            stage_start = time.perf_counter()
+            CollegeVisualizer(
+                engineer,
+                output_dir=os.path.join(output_dir, "figures"),
+                exports=exports
+            ).create_all_visualizations()
+            result["seconds"]["visualize"] = time.perf_counter() - stage_start
+    except Exception as error:
+        result["status"] = "failed"
+        result["error"] = "".join(traceback.format_exception_only(type(error), error)).strip()
+    result["seconds"]["total"] = time.perf_counter() - start
+    return result
+
+def _worker_failure(dataset_path: str, output_dir: str, error: BaseException) -> dict:
+    """Build the result for a dataset whose worker process failed."""
+    return {
+        "dataset": dataset_path,
+        "output_dir": output_dir,
+        "status": "failed",
+        "rows": None,
+        "validation_problems": None,
+        "seconds": {},
+        "error": f"Worker process failed: {error!r}",
+    }
+
+def _collect(
+    executor: ProcessPoolExecutor,
+    dataset_paths: list,
+    output_dirs: dict,
+    exports: tuple
+) -> tuple:
+    """
+    Submit datasets to a pool and gather their results as they finish.
+    
+    Args:
+        executor (ProcessPoolExecutor): Pool the datasets run in
+        dataset_paths (list): Dataset file paths
+        output_dirs (dict): Dataset path to output directory
+        exports (tuple): Export tiers each figure is written to
+    
+    Returns:
+        tuple: Results by dataset path, and the datasets whose worker pool
+            broke before they finished
+    """
+    results, broken = {}, []
+    futures = {
+        executor.submit(process_dataset, path, output_dirs[path], exports): path
+        for path in dataset_paths
+    }
+    for future in as_completed(futures):
+        path = futures[future]
+        try:
+            results[path] = future.result()
+        except BrokenProcessPool:
+            broken.append(path)
+            continue
+        except Exception as error:
+            results[path] = _worker_failure(path, output_dirs[path], error)
+        print(f"{results[path]['status']:>6}  {path}", file=sys.stderr)
+    return results, broken
+
+def run_batch(
+    dataset_paths: list,
+    output_root: str = "batch_output",
+    workers: int | None = None,
+    exports: tuple = DEFAULT_EXPORTS
+) -> list:
+    """
+    Process every dataset in a bounded pool of worker processes.
+    
+    Each worker process handles a single dataset and is then replaced, so
+    memory and matplotlib state never carry over between datasets. A worker
+    that dies takes the whole pool down with it, so the datasets that had
+    not finished are rerun one at a time in their own process; only the one
+    that dies again is reported as failed.
+    
+    Args:
+        dataset_paths (list): Dataset file paths
+        output_root (str): Directory the per-dataset output directories are created in
+        workers (int | None): Most datasets processed at once; None uses one per CPU
+        exports (tuple): Export tiers each figure is written to
+    
+    Returns:
+        list: One result dict from process_dataset per dataset, in input order
+    """
+    output_dirs = output_dirs_for(dataset_paths, output_root)
+    workers = min(workers or os.cpu_count() or 1, max(len(dataset_paths), 1))
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        results, broken = _collect(executor, dataset_paths, output_dirs, exports)
+    for path in broken:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            retried, crashed = _collect(executor, [path], output_dirs, exports)
+        if crashed:
+            retried[path] = _worker_failure(path, output_dirs[path], BrokenProcessPool("worker process died"))
+            print(f"{'failed':>6}  {path}", file=sys.stderr)
+        results.update(retried)
+    return [results[path] for path in dataset_paths]
+
+def main():
+    """Run the batch, print a per-dataset report and save it as JSON."""
+    parser = argparse.ArgumentParser(description="Run the college data pipeline over many datasets.")
+    parser.add_argument("inputs", nargs="+", help="Dataset files or glob patterns, e.g. 'data/*/*.csv'")
+    parser.add_argument("--output-root", default="batch_output", help="Directory for the per-dataset outputs")
+    parser.add_argument("--workers", type=int, default=None, help="Datasets processed at once; defaults to one per CPU")
+    parser.add_argument("--exports", nargs="+", default=list(DEFAULT_EXPORTS), choices=list(EXPORT_TARGETS),
+                        help="Export tiers to write for every dataset")
+    args = parser.parse_args()
+    
+    dataset_paths = expand_inputs(args.inputs)
+    if not dataset_paths:
+        parser.error("no datasets matched the inputs")
+    results = run_batch(dataset_paths, args.output_root, args.workers, tuple(args.exports))
+    
+    os.makedirs(args.output_root, exist_ok=True)
+    report_path = os.path.join(args.output_root, "batch_report.json")
+    with open(report_path, "w") as f:
+        json.dump(results, f, indent=2)
+    
+    for result in results:
+        seconds = result["seconds"]
+        timing = " ".join(f"{stage}={value:.2f}s" for stage, value in seconds.items())
+        detail = result["error"] or f"{result['rows']} rows, {result['validation_problems']} validation problems"
+        print(f"{result['status']:<7} {result['dataset']:<45} {timing:<45} {detail}")
+    failures = sum(result["status"] != "ok" for result in results)
+    print(f"{len(results) - failures} of {len(results)} datasets succeeded; report saved to {report_path}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
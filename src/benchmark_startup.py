@@ -0,0 +1,86 @@
+"""
+Times main.py start-up and each command in fresh interpreters, and reports
+which plotting or machine learning libraries each one imported. Exits with
+status 1 if the engineer command loads any of them.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Libraries that only the commands drawing figures should import
+HEAVY_MODULES = ("matplotlib", "seaborn", "sklearn", "scipy")
+
+# Runs main with the given arguments, then reports the heavy modules it loaded on stderr
+_RUNNER = """
+import json, sys
+import main
+if {argv!r} is not None:
+    main.main({argv!r})
+print(json.dumps([name for name in {heavy!r} if name in sys.modules]), file=sys.stderr)
+"""
+
+def time_command(argv: list | None, repeat: int = 3) -> dict:
+    """
+    Time main.py in fresh interpreters.
+    
+    Args:
+        argv (list | None): Command-line arguments for main.main, or None to
+            only import the module
+        repeat (int): Number of runs; the fastest is reported
+    
+    Returns:
+        dict: 'seconds' and the 'heavy_modules' that were imported
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, "PYTHONPATH": src_dir, "MPLBACKEND": "Agg"}
+    code = _RUNNER.format(argv=argv, heavy=HEAVY_MODULES)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(src_dir),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True
+        )
+        times.append(time.perf_counter() - start)
+    return {"seconds": min(times), "heavy_modules": json.loads(result.stderr.strip().splitlines()[-1])}
+
+def main():
+    """Print start-up and per-command times and check the engineer command stays light."""
+    parser = argparse.ArgumentParser(description="Benchmark main.py start-up time.")
+    parser.add_argument("--input", default="datasets/dataset.csv", help="Dataset the commands run on")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engineered_path = os.path.join(tmp_dir, "engineered_data.csv")
+        figures_dir = os.path.join(tmp_dir, "figures")
+        cases = {
+            "import main": None,
+            "engineer": ["engineer", "--input", args.input, "--output", engineered_path],
+            "visualize --exports preview": ["visualize", "--input", engineered_path,
+                                            "--figures", figures_dir, "--exports", "preview"],
+            "run --exports preview": ["run", "--input", args.input, "--no-save",
+                                      "--figures", figures_dir, "--exports", "preview"],
+        }
+        results = {name: time_command(argv, args.repeat) for name, argv in cases.items()}
+    
+    for name, result in results.items():
+        loaded = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{name:<30} {result['seconds']:8.3f}s  heavy modules: {loaded}")
+    
+    if results["engineer"]["heavy_modules"]:
+        print("The engineer command imported plotting or machine learning libraries")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Benchmarks loading, feature engineering, saving and every chart on synthetic
+datasets shaped like datasets/dataset.csv, from the 12-row file up to 10M rows.
+Results are written as JSON and can be compared against a stored baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import matplotlib
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from visualization_class import CollegeVisualizer
+from feature_engineering_class import FeatureEngineer
+from data_io import write_dataset
+
+# Dataset sizes benchmarked by default: dataset.csv, colleges_100.csv, then larger exports
+DEFAULT_SIZES = (12, 100, 10_000, 1_000_000)
+
+# Timed runs per stage by default; the fastest is kept, which filters out scheduling noise
+DEFAULT_REPEAT = 3
+
+# Slowdowns smaller than this many seconds are never regressions, whatever their ratio
+MIN_REGRESSION_SECONDS = 0.05
+
+def make_synthetic_dataset(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a random dataset with the same columns as datasets/dataset.csv.
+    
+    Args:
+        rows (int): Number of colleges to generate
+        seed (int): Seed for the random number generator
+    
+    Returns:
+        pd.DataFrame: The synthetic dataset
+    """
+    rng = np.random.default_rng(seed)
+    graduate_rate_4yr = rng.uniform(0.2, 0.9, rows).round(3)
+    return pd.DataFrame({
+        "colleges": [f"college_{i}" for i in range(rows)],
+        "application_volume": rng.integers(500, 120_000, rows),
+        "admission_rate": rng.uniform(0.03, 0.95, rows).round(3),
+        "graduate_rate_4yr": graduate_rate_4yr,
+        "graduate_rate_6yr": np.minimum(graduate_rate_4yr + rng.uniform(0, 0.2, rows), 1).round(3),
+        "tuition_cost": rng.integers(10_000, 70_000, rows),
+    })
+
+def measure(step, repeat: int = 1, track_memory: bool = True) -> dict:
+    """
+    Time a step and, optionally, record its peak traced memory.
+    
+    Timing runs are kept separate from the memory run so tracemalloc's
+    overhead does not inflate the reported time.
+    
+    Args:
+        step: Callable taking no arguments
+        repeat (int): Number of timed runs; the fastest is reported
+        track_memory (bool): Whether to run the step once more under tracemalloc
+    
+    Returns:
+        dict: 'seconds' and 'peak_bytes' (None when memory is not tracked)
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        step()
+        times.append(time.perf_counter() - start)
+    
+    peak_bytes = None
+    if track_memory:
+        tracemalloc.start()
+        try:
+            step()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak_bytes}
+
+def benchmark_size(
+    rows: int,
+    work_dir: str,
+    file_format: str = "csv",
+    max_chart_rows: int = 10_000,
+    repeat: int = DEFAULT_REPEAT,
+    track_memory: bool = True
+) -> list:
+    """
+    Benchmark every pipeline stage on one synthetic dataset size.
+    
+    Args:
+        rows (int): Number of synthetic colleges
+        work_dir (str): Scratch directory for input, output and figure files
+        file_format (str): Format of the input and engineered files
+        max_chart_rows (int): Largest size for which charts are rendered
+        repeat (int): Number of timed runs per stage
+        track_memory (bool): Whether to record peak memory per stage
+    
+    Returns:
+        list: One result dict per stage
+    """
+    input_path = os.path.join(work_dir, f"input_{rows}.{file_format}")
+    output_path = os.path.join(work_dir, f"engineered_{rows}.{file_format}")
+    write_dataset(make_synthetic_dataset(rows), input_path)
+    
+    results = []
+    def record(stage: str, step) -> None:
+        # Keep progress messages such as "Engineered dataset saved" out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure(step, repeat=repeat, track_memory=track_memory)
+        results.append({"rows": rows, "stage": stage, **result})
+    
+    record("load", lambda: FeatureEngineer(input_path))
+    engineer = FeatureEngineer(input_path)
+    record("engineer", engineer.engineer_all_features)
+    record("save", lambda: engineer.save_engineered_data(output_path))
+    
+    if rows <= max_chart_rows:
+        visualizer = CollegeVisualizer(engineer, output_dir=os.path.join(work_dir, "figures"))
+        for name in visualizer.chart_specs:
+            record(f"chart:{name}", lambda name=name: visualizer.render_chart(name))
+    return results
+
+def run_benchmarks(
+    sizes=DEFAULT_SIZES,
+    file_format: str = "csv",
+    max_chart_rows: int = 10_000,
+    repeat: int = DEFAULT_REPEAT,
+    track_memory: bool = True
+) -> dict:
+    """
+    Benchmark every stage across dataset sizes.
+    
+    Args:
+        sizes: Dataset sizes (rows) to benchmark
+        file_format (str): Format of the input and engineered files
+        max_chart_rows (int): Largest size for which charts are rendered
+        repeat (int): Number of timed runs per stage
+        track_memory (bool): Whether to record peak memory per stage
+    
+    Returns:
+        dict: Environment metadata and the list of per-stage results
+    """
+    matplotlib.use("Agg")
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for rows in sizes:
+            print(f"Benchmarking {rows} rows...", file=sys.stderr)
+            results.extend(benchmark_size(rows, work_dir, file_format, max_chart_rows, repeat, track_memory))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "seaborn": sns.__version__,
+            "format": file_format,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def compare_to_baseline(
+    current: dict,
+    baseline: dict,
+    tolerance: float = 0.2,
+    min_seconds: float = MIN_REGRESSION_SECONDS
+) -> list:
+    """
+    Find stages that got slower than the baseline by more than the tolerance.
+    
+    A stage only counts as regressed when it is both relatively and
+    absolutely slower, so millisecond stages cannot fail on timer noise.
+    
+    Args:
+        current (dict): Results from run_benchmarks
+        baseline (dict): Previously stored results from run_benchmarks
+        tolerance (float): Allowed relative slowdown (0.2 = 20%)
+        min_seconds (float): Slowdown in seconds a stage must also exceed
+    
+    Returns:
+        list: One dict per regressed stage with both timings and their ratio
+    """
+    baseline_seconds = {
+        (result["rows"], result["stage"]): result["seconds"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        key = (result["rows"], result["stage"])
+        if key not in baseline_seconds or baseline_seconds[key] <= 0:
+            continue
+        ratio = result["seconds"] / baseline_seconds[key]
+        if ratio > 1 + tolerance and result["seconds"] - baseline_seconds[key] > min_seconds:
+            regressions.append({
+                "rows": result["rows"],
+                "stage": result["stage"],
+                "baseline_seconds": baseline_seconds[key],
+                "seconds": result["seconds"],
+                "ratio": ratio,
+            })
+    return regressions
+
+def main():
+    """Run the benchmarks, save the results and report regressions against a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the college data pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Dataset sizes in rows, up to 10000000")
+    parser.add_argument("--format", default="csv", choices=["csv", "parquet", "feather"],
+                        help="Format of the input and engineered files")
+    parser.add_argument("--max-chart-rows", type=int, default=10_000,
+                        help="Largest dataset size for which charts are rendered")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per stage")
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak memory tracking")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the results")
+    parser.add_argument("--baseline", help="Stored results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown")
+    parser.add_argument("--min-seconds", type=float, default=MIN_REGRESSION_SECONDS,
+                        help="Absolute slowdown a stage must also exceed to count as a regression")
+    args = parser.parse_args()
+    
+    current = run_benchmarks(
+        sizes=args.sizes,
+        file_format=args.format,
+        max_chart_rows=args.max_chart_rows,
+        repeat=args.repeat,
+        track_memory=not args.no_memory
+    )
+    with open(args.output, "w") as f:
+        json.dump(current, f, indent=2)
+    
+    for result in current["results"]:
+        peak = "" if result["peak_bytes"] is None else f"{result['peak_bytes'] / 1024 ** 2:10.1f} MB"
+        print(f"{result['rows']:>10} {result['stage']:<55} {result['seconds']:10.4f}s {peak}")
+    print(f"Results saved to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(current, baseline, args.tolerance, args.min_seconds)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['rows']} rows {regression['stage']}: "
+                f"{regression['baseline_seconds']:.4f}s -> {regression['seconds']:.4f}s "
+                f"({regression['ratio']:.2f}x)"
+            )
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+if __name__ == "__main__":
+    main()
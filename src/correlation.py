@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+
+# Correlation methods supported by CorrelationEngine
+METHODS = ("pearson", "spearman")
+
+def _first_column_correlations(values: np.ndarray) -> np.ndarray:
+    """
+    Spearman correlation of the first column of a complete array with each other column.
+    
+    Args:
+        values (np.ndarray): Array of shape (rows, columns) without missing values
+    
+    Returns:
+        np.ndarray: One correlation per column after the first; NaN for constant columns
+    """
+    ranks = pd.DataFrame(values).rank().to_numpy()
+    ranks -= ranks.mean(axis=0)
+    squares = (ranks * ranks).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ranks[:, 1:].T @ ranks[:, 0] / np.sqrt(squares[0] * squares[1:])
+
+class CorrelationEngine:
+    """A class to compute and reuse correlation matrices over the numeric columns of a dataset."""
+    
+    def __init__(self, df: pd.DataFrame, columns: list | None = None, min_periods: int = 2):
+        """
+        Initialize the CorrelationEngine.
+        
+        Args:
+            df (pd.DataFrame): Dataset to correlate
+            columns (list | None): Columns to correlate; None uses every numeric column
+            min_periods (int): Fewest rows with both values present for a
+                pair to get a correlation; pairs with fewer are NaN
+        """
+        if columns is None:
+            columns = list(df.select_dtypes(include="number").columns)
+        self.df = df
+        self.columns = list(columns)
+        self.min_periods = min_periods
+        self._matrices = {}
+    
+    def _values(self, method: str) -> np.ndarray:
+        """
+        Get the float32 matrix correlated for a method: the values, or their ranks for Spearman.
+        
+        Args:
+            method (str): 'pearson' or 'spearman'
+        
+        Returns:
+            np.ndarray: Array of shape (rows, columns) with NaN for missing values
+        """
+        data = self.df[self.columns]
+        if method == "spearman":
+            data = data.rank()
+        return data.to_numpy(dtype=np.float32, na_value=np.nan)
+    
+    def matrix(self, method: str = "pearson") -> pd.DataFrame:
+        """
+        Get the correlation matrix, computing it on first use.
+        
+        Each matrix is computed once per method with float32 matrix products.
+        Missing values are handled pairwise: each pair is correlated over
+        the rows where both values are present. For Spearman, columns
+        without missing values are ranked once; pairs involving a column
+        with missing values are re-ranked over their shared rows, as pandas
+        does, which costs one ranking per such pair.
+        
+        Args:
+            method (str): 'pearson' or 'spearman'
+        
+        Returns:
+            pd.DataFrame: Square correlation matrix labelled by column
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown correlation method: {method}")
+        if method not in self._matrices:
+            values = self._values(method)
+            present = ~np.isnan(values)
+            # Centering first keeps float32 sums of products from cancelling
+            values = values - np.nanmean(values, axis=0) if len(values) else values
+            values[~present] = 0
+            if present.all():
+                counts = np.full((values.shape[1],) * 2, len(values), dtype=np.float32)
+                products = values.T @ values
+                squares = np.diag(products)
+                variances = np.broadcast_to(squares[:, None], products.shape)
+                sums = np.zeros_like(products)
+            else:
+                mask = present.astype(np.float32)
+                counts = mask.T @ mask
+                products = values.T @ values
+                # Entry [i, j] is the sum of column i over rows where column j is present
+                sums = values.T @ mask
+                variances = (values * values).T @ mask
+            covariance = products - sums * sums.T / np.maximum(counts, 1)
+            spread_i = variances - sums * sums / np.maximum(counts, 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlation = covariance / np.sqrt(spread_i * spread_i.T)
+            correlation = np.clip(correlation, -1, 1)
+            if method == "spearman" and not present.all():
+                self._rerank_pairs(correlation, present, counts)
+            correlation[counts < self.min_periods] = np.nan
+            diagonal = np.diag_indices_from(correlation)
+            correlation[diagonal] = np.where(np.isnan(correlation[diagonal]), np.nan, 1)
+            self._matrices[method] = pd.DataFrame(correlation, index=self.columns, columns=self.columns)
+        return self._matrices[method]
+    
+    def _rerank_pairs(self, correlation: np.ndarray, present: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Recompute, in place, the Spearman correlation of every pair that involves a column with missing values.
+        
+        Ranks taken over a whole column differ from ranks over the rows a
+        pair shares, so these pairs are ranked again on their shared rows.
+        Against each incomplete column, every complete column shares the
+        same rows, so those are ranked together in one pass; only pairs of
+        two incomplete columns are ranked one pair at a time.
+        
+        Args:
+            correlation (np.ndarray): Matrix to update
+            present (np.ndarray): Mask of present values, shape (rows, columns)
+            counts (np.ndarray): Number of shared rows per pair
+        """
+        data = self.df[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        complete = present.all(axis=0)
+        complete_columns = np.flatnonzero(complete)
+        incomplete = np.flatnonzero(~complete)
+        for position, i in enumerate(incomplete):
+            if complete_columns.size and counts[i, complete_columns[0]] >= self.min_periods:
+                values = data[present[:, i]][:, [i, *complete_columns]]
+                correlation[i, complete_columns] = correlation[complete_columns, i] = _first_column_correlations(values)
+            for j in incomplete[position + 1:]:
+                if counts[i, j] >= self.min_periods:
+                    shared = present[:, i] & present[:, j]
+                    correlation[i, j] = correlation[j, i] = _first_column_correlations(data[shared][:, [i, j]])[0]
+    
+    def top_pairs(self, k: int = 10, method: str = "pearson", absolute: bool = True) -> pd.DataFrame:
+        """
+        Find the most strongly correlated pairs of distinct columns.
+        
+        Args:
+            k (int): Number of pairs to return
+            method (str): 'pearson' or 'spearman'
+            absolute (bool): Rank by absolute correlation, so strong negative
+                pairs count; False ranks by signed value
+        
+        Returns:
+            pd.DataFrame: Columns 'column_a', 'column_b' and 'correlation',
+                strongest pair first
+        """
+        correlation = self.matrix(method).to_numpy()
+        rows, cols = np.triu_indices(len(self.columns), k=1)
+        values = correlation[rows, cols]
+        strength = np.abs(values) if absolute else values.copy()
+        strength[np.isnan(strength)] = -np.inf
+        k = min(k, len(values))
+        # Partition first so only the k strongest pairs are sorted
+        top = np.argpartition(-strength, k - 1)[:k] if k else np.array([], dtype=int)
+        top = top[np.argsort(-strength[top], kind="stable")]
+        return pd.DataFrame({
+            "column_a": np.asarray(self.columns, dtype=object)[rows[top]],
+            "column_b": np.asarray(self.columns, dtype=object)[cols[top]],
+            "correlation": values[top],
+        })
+    
+    def clustered_order(self, method: str = "pearson") -> list:
+        """
+        Order columns so that strongly correlated columns sit next to each other.
+        
+        Columns are clustered hierarchically (average linkage) on the distance
+        1 - |correlation|; pairs without a correlation count as uncorrelated.
+        
+        Args:
+            method (str): 'pearson' or 'spearman'
+        
+        Returns:
+            list: Column names in clustered order
+        """
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+        
+        if len(self.columns) < 3:
+            return list(self.columns)
+        distance = 1 - np.abs(np.nan_to_num(self.matrix(method).to_numpy(dtype=np.float64)))
+        np.fill_diagonal(distance, 0)
+        condensed = squareform((distance + distance.T) / 2, checks=False)
+        order = leaves_list(linkage(condensed, method="average"))
+        return [self.columns[position] for position in order]
+    
+    def clustered_matrix(self, method: str = "pearson") -> pd.DataFrame:
+        """
+        Get the correlation matrix with rows and columns in clustered order.
+        
+        Args:
+            method (str): 'pearson' or 'spearman'
+        
+        Returns:
+            pd.DataFrame: The reordered correlation matrix
+        """
+        order = self.clustered_order(method)
+        return self.matrix(method).loc[order, order]
@@ -0,0 +1,99 @@
+import os
+import pandas as pd
+from schema import CSV_READ_OPTIONS, apply_schema
+from instrumentation import span
+
+# File extensions mapped to the format used to read and write them
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+}
+
+def dataset_format(path: str) -> str:
+    """
+    Determine the storage format of a dataset from its file extension.
+    
+    Args:
+        path (str): Path to the dataset file
+    
+    Returns:
+        str: One of 'csv', 'parquet' or 'feather'
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported dataset format: {extension}")
+    return FORMATS[extension]
+
+def dataset_columns(path: str) -> list:
+    """
+    Read the column names of a dataset without loading its rows.
+    
+    Args:
+        path (str): Path to the dataset file
+    
+    Returns:
+        list: Column names in file order
+    """
+    file_format = dataset_format(path)
+    if file_format == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    
+    import pyarrow.parquet as pq
+    import pyarrow.ipc as ipc
+    if file_format == "parquet":
+        return list(pq.read_schema(path).names)
+    with ipc.open_file(path) as reader:
+        return list(reader.schema.names)
+
+def read_dataset(path: str, columns: list | None = None, dtypes: dict | None = None) -> pd.DataFrame:
+    """
+    Load a dataset, picking CSV, Parquet or Feather from the file extension.
+    
+    CSV numbers with thousands separators (e.g., "54,008") are parsed as numbers.
+    
+    Args:
+        path (str): Path to the dataset file
+        columns (list | None): Columns to load; columns missing from the file
+            are skipped, and None loads every column
+        dtypes (dict | None): Compact dtypes to convert columns to, e.g.
+            schema.COLUMN_DTYPES; None keeps the dtypes pandas infers
+    
+    Returns:
+        pd.DataFrame: The loaded dataset
+    """
+    file_format = dataset_format(path)
+    with span("load", path=path, format=file_format):
+        if columns is not None:
+            wanted = set(columns)
+            columns = [column for column in dataset_columns(path) if column in wanted]
+        
+        if file_format == "csv":
+            df = pd.read_csv(path, usecols=columns, **CSV_READ_OPTIONS)
+        elif file_format == "parquet":
+            df = pd.read_parquet(path, columns=columns)
+        else:
+            df = pd.read_feather(path, columns=columns)
+        
+        if dtypes is not None:
+            apply_schema(df, dtypes)
+    return df
+
+def write_dataset(df: pd.DataFrame, path: str) -> None:
+    """
+    Save a dataset, picking CSV, Parquet or Feather from the file extension.
+    
+    Args:
+        df (pd.DataFrame): Dataset to save
+        path (str): Path where the dataset should be saved
+    """
+    file_format = dataset_format(path)
+    with span("save", path=path, format=file_format):
+        if file_format == "csv":
+            df.to_csv(path, index=False)
+        elif file_format == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.reset_index(drop=True).to_feather(path)
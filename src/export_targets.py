@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+# Kept apart from visualization_class so command-line parsing can list the
+# tiers without importing matplotlib or seaborn
+
+@dataclass(frozen=True)
+class ExportTarget:
+    """
+    One file written for every chart: a format, a resolution and a directory.
+    
+    Attributes:
+        name (str): Tier name used to select the target (e.g., 'preview')
+        format (str): File format passed to savefig: 'png', 'svg' or 'pdf'
+        dpi (int): Resolution of the file and of any rasterized layers in it
+        subdir (str): Directory under the output directory the files go to;
+            '' writes into the output directory itself
+    """
+    name: str
+    format: str
+    dpi: int
+    subdir: str = ""
+    
+    def filename(self, chart_name: str) -> str:
+        """Name of the file a chart is exported to for this target."""
+        return f"{chart_name}.{self.format}"
+
+# Export tiers that can be selected by name
+EXPORT_TARGETS = {
+    "full": ExportTarget("full", "png", 300),
+    "preview": ExportTarget("preview", "png", 72, "preview"),
+    "svg": ExportTarget("svg", "svg", 150, "svg"),
+    "pdf": ExportTarget("pdf", "pdf", 150, "pdf"),
+}
+
+# Tiers written when none are chosen: the full-resolution PNGs in the output directory
+DEFAULT_EXPORTS = ("full",)
@@ -1,63 +1,414 @@
+import inspect
+import os
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
+from typing import Callable
+from data_io import dataset_format, read_dataset, write_dataset
+from pipeline_cache import PipelineCache, hash_dataframe, hash_values
+from schema import CSV_READ_OPTIONS, LOSSLESS_DTYPES, apply_schema
+from instrumentation import span
+from validation import validate_dataset
+
+# Columns that, when present, identify a row together with the college name
+PERIOD_COLUMNS = ("year", "academic_year", "period")
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    Declarative description of one engineered feature.
+    
+    Attributes:
+        name (str): Name of the output column
+        inputs (tuple): Dataset columns or other feature names the feature is computed from
+        compute (Callable): Function taking one NumPy array per input, in order,
+            and returning the feature values as an array
+        dtype (str): dtype of the output column
+        decimals (int | None): Decimal places to round to, or None for no rounding
+    """
+    name: str
+    inputs: tuple
+    compute: Callable
+    dtype: str = "float64"
+    decimals: int | None = None
+
+# Features computed by engineer_all_features, in output column order
+FEATURE_SPECS = (
+    FeatureSpec("avg_graduation_rate", ("graduate_rate_4yr", "graduate_rate_6yr"),
+                lambda rate_4yr, rate_6yr: (rate_4yr + rate_6yr) / 2, decimals=3),
+    FeatureSpec("graduation_rate_improvement", ("graduate_rate_4yr", "graduate_rate_6yr"),
+                lambda rate_4yr, rate_6yr: rate_6yr - rate_4yr, decimals=3),
+    FeatureSpec("selectivity_score", ("admission_rate",),
+                lambda admission_rate: 1 / admission_rate, decimals=2),
+    FeatureSpec("cohort_size", ("application_volume", "admission_rate"),
+                lambda application_volume, admission_rate: application_volume * admission_rate, decimals=2),
+)
+
+def _code_identity(code) -> tuple:
+    """Describe a code object by its bytecode, constants and names, recursing into nested code."""
+    constants = tuple(
+        _code_identity(constant) if inspect.iscode(constant) else repr(constant)
+        for constant in code.co_consts
+    )
+    return (code.co_code.hex(), constants, code.co_names)
+
+def _widened(values: pd.Series) -> np.ndarray:
+    """
+    Get a column as a NumPy array for feature arithmetic.
+    
+    Integer columns are stored compactly (e.g. int32) but widened to 64 bits
+    here, so products such as application_volume * tuition_cost cannot overflow.
+    
+    Args:
+        values (pd.Series): Input column
+    
+    Returns:
+        np.ndarray: The column's values, with integers as int64 or uint64
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iu":
+        return values.to_numpy(dtype="int64" if values.dtype.kind == "i" else "uint64")
+    return values.to_numpy()
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash each row by value, independently of how its columns are stored.
+    
+    Numbers are hashed as float64 and everything else as Python objects, so
+    a saved file (float with NaN, plain strings) and a fresh load (int32,
+    categorical) hash equal wherever their values are equal.
+    
+    Args:
+        df (pd.DataFrame): Rows to hash
+    
+    Returns:
+        np.ndarray: One uint64 hash per row
+    """
+    common = {
+        column: "float64" if pd.api.types.is_numeric_dtype(df[column]) else object
+        for column in df.columns
+    }
+    return pd.util.hash_pandas_object(df.astype(common), index=False).to_numpy()
+
+def compute_identity(compute: Callable) -> tuple:
+    """
+    Describe a feature's compute function for cache keys.
+    
+    Bytecode alone is the same for functions that differ only in their
+    constants (t / 1000 and t / 100), so constants, referenced names, closure
+    values and, where available, the source are included too.
+    
+    Args:
+        compute (Callable): The feature's compute function
+    
+    Returns:
+        tuple: Values that change whenever the function's behaviour can change
+    """
+    try:
+        source = inspect.getsource(compute)
+    except (OSError, TypeError):
+        source = None
+    code = getattr(compute, "__code__", None)
+    if code is None:
+        # Builtins and NumPy ufuncs have no bytecode; their repr names them
+        return (repr(compute), source)
+    closure = tuple(repr(cell.cell_contents) for cell in compute.__closure__ or ())
+    return (source, _code_identity(code), closure, repr(compute.__defaults__))
 
 class FeatureEngineer:
     """A class to handle feature engineering for college datasets."""
     
-    def __init__(self, dataset_path: str):
+    def __init__(self, dataset_path: str | pd.DataFrame, validate: bool = True):
         """
         Initialize the FeatureEngineer with a dataset.
         
         Args:
-            dataset_path (str): Path to the CSV dataset file
+            dataset_path (str | pd.DataFrame): Path to the dataset file (CSV,
+                Parquet or Feather), loaded with the lossless compact dtypes
+                from schema.py, or a dataframe that is already in memory
+            validate (bool): Whether to check the dataset on load; problems
+                are kept in validation_report rather than raised
+        """
+        if isinstance(dataset_path, pd.DataFrame):
+            self.df = dataset_path
+        else:
+            self.df = read_dataset(dataset_path, dtypes=LOSSLESS_DTYPES)
+        self.feature_specs = {spec.name: spec for spec in FEATURE_SPECS}
+        self.validation_report = None
+        if validate:
+            self.validate()
+    
+    def _key_columns(self) -> list:
+        """Return 'colleges' plus any period column present, the columns identifying a row."""
+        return ["colleges"] + [column for column in PERIOD_COLUMNS if column in self.df.columns]
+    
+    def validate(self) -> pd.DataFrame:
+        """
+        Check the dataset for missing, out-of-range and duplicate values.
+        
+        Returns:
+            pd.DataFrame: Per-row problem report from validation.validate_dataset,
+                also kept as validation_report
+        """
+        with span("validate", rows=len(self.df)):
+            self.validation_report = validate_dataset(self.df, self._key_columns())
+        if not self.validation_report.empty:
+            print(
+                f"Validation found {len(self.validation_report)} problems in "
+                f"{self.validation_report['row'].nunique()} rows"
+            )
+        return self.validation_report
+    
+    def register_feature(self, spec: FeatureSpec) -> None:
+        """
+        Add a feature to the set computed by engineer_all_features.
+        
+        Args:
+            spec (FeatureSpec): Feature to register; replaces any feature with the same name
+        """
+        self.feature_specs[spec.name] = spec
+    
+    def _resolve_features(self, names: list) -> list:
+        """
+        Order features so that every feature comes after the features it depends on.
+        
+        Args:
+            names (list): Names of the requested features
+        
+        Returns:
+            list: Feature specs to evaluate, dependencies first
+        """
+        ordered = []
+        resolved = set()
+        visiting = set()
+        
+        def visit(name: str) -> None:
+            if name in resolved:
+                return
+            if name in visiting:
+                raise ValueError(f"Feature dependency cycle through '{name}'.")
+            visiting.add(name)
+            spec = self.feature_specs[name]
+            for column in spec.inputs:
+                if column in self.feature_specs:
+                    visit(column)
+                elif column not in self.df.columns:
+                    raise KeyError(f"Feature '{name}' needs missing column '{column}'.")
+            visiting.discard(name)
+            resolved.add(name)
+            ordered.append(spec)
+        
+        for name in names:
+            visit(name)
+        return ordered
+    
+    def compute_features(self, names: list | None = None, rounded: bool = True) -> None:
+        """
+        Compute features in one vectorized pass and add them to the dataframe.
+        
+        Input columns are read into NumPy arrays once, with integers widened
+        to 64 bits, and shared by every feature; features that other requested features depend on are
+        computed but only added to the dataframe if they were requested.
+        
+        Args:
+            names (list | None): Names of the features to add, or None for every registered feature
+            rounded (bool): Whether to round each feature to its declared decimal places
         """
-        self.df = pd.read_csv(dataset_path)
+        if names is None:
+            names = list(self.feature_specs)
+        arrays = {}
+        for spec in self._resolve_features(names):
+            inputs = []
+            for column in spec.inputs:
+                if column not in arrays:
+                    arrays[column] = _widened(self.df[column])
+                inputs.append(arrays[column])
+            with span(f"feature:{spec.name}"):
+                values = spec.compute(*inputs)
+                if rounded and spec.decimals is not None:
+                    values = np.round(values, spec.decimals)
+                arrays[spec.name] = values.astype(spec.dtype, copy=False)
+        
+        # Assigning arrays directly adds a block per column without copying the frame
+        for name in names:
+            self.df[name] = arrays[name]
+    
+    def _feature_definitions(self) -> list:
+        """Describe the registered features, including their compute code, for cache keys."""
+        return [
+            (spec.name, spec.inputs, spec.dtype, spec.decimals, compute_identity(spec.compute))
+            for spec in self.feature_specs.values()
+        ]
     
     def create_average_graduation_rate(self) -> None:
         """Create average graduation rate feature from 4-year and 6-year rates."""
-        self.df["avg_graduation_rate"] = (
-            self.df["graduate_rate_4yr"] + self.df["graduate_rate_6yr"]
-        ) / 2
+        self.compute_features(["avg_graduation_rate"], rounded=False)
     
     def create_graduation_rate_improvement(self) -> None:
         """Create graduation rate improvement feature as difference between 6-year and 4-year rates."""
-        self.df["graduation_rate_improvement"] = (
-            self.df["graduate_rate_6yr"] - self.df["graduate_rate_4yr"]
-        )
+        self.compute_features(["graduation_rate_improvement"], rounded=False)
     
     def create_selectivity_score(self) -> None:
         """Create selectivity score based on reciprocal of admission rate."""
-        self.df["selectivity_score"] = 1 / self.df["admission_rate"]
+        self.compute_features(["selectivity_score"], rounded=False)
     
     def create_cohort_size(self) -> None:
         """Create cohort size feature (application_volume * admission_rate)."""
-        self.df["cohort_size"] = self.df["application_volume"] * self.df["admission_rate"]
+        self.compute_features(["cohort_size"], rounded=False)
     
     def round_features(self) -> None:
-        """Round engineered features to specified decimal places."""
-        self.df['avg_graduation_rate'] = self.df['avg_graduation_rate'].round(3)
-        self.df['graduation_rate_improvement'] = self.df['graduation_rate_improvement'].round(3)
-        self.df['selectivity_score'] = self.df['selectivity_score'].round(2)
-        self.df['cohort_size'] = self.df['cohort_size'].round(2)
-    
-    def engineer_all_features(self) -> None:
-        """Execute all feature engineering steps in sequence."""
-        self.create_average_graduation_rate()
-        self.create_graduation_rate_improvement()
-        self.create_selectivity_score()
-        self.create_cohort_size()
-        self.round_features()
+        """Round engineered features to their declared decimal places."""
+        for spec in self.feature_specs.values():
+            if spec.decimals is not None and spec.name in self.df.columns:
+                self.df[spec.name] = self.df[spec.name].round(spec.decimals)
+    
+    def engineer_all_features(self, cache: PipelineCache | None = None) -> None:
+        """
+        Compute every registered feature in one vectorized, rounded pass.
+        
+        Args:
+            cache (PipelineCache | None): Cache of engineered datasets keyed by
+                the input data and the feature definitions; on a hit the
+                cached result is loaded instead of being recomputed
+        """
+        if cache is not None:
+            # Edits to this module or to the registered features invalidate old entries
+            key = hash_values(
+                hash_dataframe(self.df),
+                inspect.getsource(inspect.getmodule(type(self))),
+                self._feature_definitions()
+            )
+            cached_path = cache.get(key, ".parquet")
+            if cached_path is not None:
+                self.df = read_dataset(cached_path)
+                return
+        
+        with span("engineer_all_features", rows=len(self.df)):
+            self.compute_features()
+        
+        if cache is not None:
+            tmp_path = cache.temp_path(".parquet")
+            write_dataset(self.df, tmp_path)
+            cache.put(key, ".parquet", tmp_path, move=True)
     
     def save_engineered_data(self, output_path: str = 'datasets/engineered_data.csv') -> None:
         """
-        Save the engineered dataset to a CSV file.
+        Save the engineered dataset, as CSV, Parquet or Feather by file extension.
         
         Args:
             output_path (str): Path where the engineered dataset should be saved
         """
-        self.df.to_csv(output_path, index=False)
+        write_dataset(self.df, output_path)
         print("Engineered dataset saved")
     
+    @classmethod
+    def engineer_in_chunks(
+        cls,
+        dataset_path: str,
+        output_path: str = 'datasets/engineered_data.csv',
+        chunksize: int = 100_000
+    ) -> int:
+        """
+        Engineer features for a large CSV one chunk at a time.
+        
+        Each chunk is read, engineered and appended to the output file before
+        the next one is read, so peak memory depends on the chunk size rather
+        than the size of the dataset.
+        
+        Args:
+            dataset_path (str): Path to the CSV dataset file
+            output_path (str): Path where the engineered CSV should be saved
+            chunksize (int): Number of rows to read and engineer at a time
+        
+        Returns:
+            int: Number of rows written to the output file
+        """
+        for path in (dataset_path, output_path):
+            if dataset_format(path) != "csv":
+                raise ValueError(f"Chunked feature engineering only supports CSV files: {path}")
+        
+        rows_written = 0
+        for chunk in pd.read_csv(dataset_path, chunksize=chunksize, **CSV_READ_OPTIONS):
+            engineer = cls(apply_schema(chunk, LOSSLESS_DTYPES))
+            engineer.engineer_all_features()
+            engineer.df.to_csv(
+                output_path,
+                mode='w' if rows_written == 0 else 'a',
+                header=rows_written == 0,
+                index=False
+            )
+            rows_written += len(chunk)
+        
+        print("Engineered dataset saved")
+        return rows_written
+    
+    def engineer_incremental(
+        self,
+        engineered_path: str = 'datasets/engineered_data.csv',
+        key_columns: list | None = None
+    ) -> int:
+        """
+        Engineer features only for rows that are new or changed since the last saved output.
+        
+        Rows are matched to the existing engineered output by their key
+        columns. Rows whose input columns are unchanged keep their saved
+        features; the rest are engineered and merged in, in input order, and
+        the result is saved back to engineered_path. Rows no longer in the
+        input are dropped from the output.
+        
+        Args:
+            engineered_path (str): Path of the previously engineered dataset;
+                if it does not exist, has no rows or lacks a registered feature,
+                every row is engineered
+            key_columns (list | None): Columns identifying a row; defaults to
+                'colleges' plus any period column present in the dataset
+        
+        Returns:
+            int: Number of rows whose features were computed
+        """
+        if key_columns is None:
+            key_columns = self._key_columns()
+        # Feature columns already in the input are recomputed, so they do not count as changes
+        input_columns = [column for column in self.df.columns if column not in self.feature_specs]
+        
+        features = {spec.name: spec.dtype for spec in self.feature_specs.values()}
+        existing = read_dataset(engineered_path) if os.path.exists(engineered_path) else None
+        if existing is None or existing.empty or not {*input_columns, *features} <= set(existing.columns):
+            self.engineer_all_features()
+            self.save_engineered_data(engineered_path)
+            return len(self.df)
+        
+        self.df = self.df.reset_index(drop=True)
+        input_keys = pd.MultiIndex.from_frame(self.df[key_columns])
+        existing_keys = pd.MultiIndex.from_frame(existing[key_columns])
+        if input_keys.has_duplicates or existing_keys.has_duplicates:
+            raise ValueError(f"Rows are not uniquely identified by {key_columns}.")
+        
+        # Compare whole input rows by hash; positions is -1 for new keys
+        positions = existing_keys.get_indexer(input_keys)
+        input_hashes = _row_hashes(self.df[input_columns])
+        existing_hashes = _row_hashes(existing[input_columns])
+        unchanged = (positions >= 0) & (input_hashes == existing_hashes[positions])
+        changed = ~unchanged
+        
+        # Unchanged rows keep their saved features; their inputs come from this load,
+        # since saved files lose dtypes (e.g. an integer column that once had nulls)
+        columns = list(self.df.columns) + [name for name in features if name not in self.df.columns]
+        saved_features = existing.iloc[positions[unchanged]][list(features)].astype(features)
+        kept = pd.concat(
+            [self.df.loc[unchanged, input_columns], saved_features.set_axis(self.df.index[unchanged])],
+            axis=1
+        )[columns]
+        if not changed.any() and len(kept) == len(existing):
+            self.df = kept
+            return 0
+        
+        delta = FeatureEngineer(self.df[changed].copy(), validate=False)
+        delta.feature_specs = self.feature_specs
+        delta.engineer_all_features()
+        self.df = pd.concat([kept, delta.df[columns]]).sort_index()
+        self.save_engineered_data(engineered_path)
+        return int(changed.sum())
+    
     def get_dataframe(self) -> pd.DataFrame:
         """Return the current dataframe."""
         return self.df
@@ -0,0 +1,185 @@
+"""
+Opt-in timing and memory instrumentation for pipeline steps.
+
+Code wraps steps in span("name"); nothing is recorded unless a Tracer has
+been enabled with enable_tracing(). Spans opened in rendering worker
+processes are not collected.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# Tracer that span() records into, or None when tracing is off
+_active_tracer = None
+
+class Tracer:
+    """A class to collect wall time, CPU time and memory for nested pipeline steps."""
+    
+    def __init__(self, track_memory: bool = True):
+        """
+        Initialize the Tracer.
+        
+        Args:
+            track_memory (bool): Whether to record memory allocated by each step
+                with tracemalloc, which slows allocation-heavy steps down
+        """
+        self.track_memory = track_memory
+        self.events = []
+        self._depth = 0
+        # Highest traced memory seen so far by each open span, outermost first
+        self._peaks = []
+        self._origin = time.perf_counter()
+    
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        """
+        Record one step.
+        
+        With memory tracking, 'peak_bytes' is how far traced memory rose above
+        its level at the start of the step, so buffers that are allocated and
+        freed inside the step still count; 'net_bytes' is what the step left
+        allocated. tracemalloc keeps a single peak, so each span saves its
+        enclosing span's peak before resetting it and hands its own up on exit.
+        Only Python and NumPy allocations are traced; buffers allocated in
+        C++ (such as Agg's render buffer during savefig) are not.
+        
+        Args:
+            name (str): Name of the step (e.g., 'load', 'chart:correlation_heatmap')
+            **args: Extra details stored with the event
+        """
+        memory_before = None
+        if self.track_memory:
+            memory_before, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(memory_before)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            wall_end = time.perf_counter()
+            net_bytes = peak_bytes = None
+            if self.track_memory:
+                memory_after, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._peaks.pop())
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                net_bytes = memory_after - memory_before
+                peak_bytes = peak - memory_before
+            event = {
+                "name": name,
+                "start_s": wall_start - self._origin,
+                "wall_s": wall_end - wall_start,
+                "cpu_s": time.process_time() - cpu_start,
+                "peak_bytes": peak_bytes,
+                "net_bytes": net_bytes,
+                "depth": self._depth,
+                "thread": threading.get_ident(),
+                "args": args,
+            }
+            self.events.append(event)
+    
+    def write_jsonl(self, path: str) -> None:
+        """
+        Write the recorded steps as JSON lines, one event per line in completion order.
+        
+        Args:
+            path (str): Path of the trace file
+        """
+        with open(path, "w") as f:
+            for event in self.events:
+                f.write(json.dumps(event) + "\n")
+    
+    def write_chrome_trace(self, path: str) -> None:
+        """
+        Write the recorded steps in Chrome trace format (chrome://tracing, Perfetto).
+        
+        Args:
+            path (str): Path of the trace file
+        """
+        trace_events = [
+            {
+                "name": event["name"],
+                "ph": "X",
+                "ts": event["start_s"] * 1e6,
+                "dur": event["wall_s"] * 1e6,
+                "pid": os.getpid(),
+                "tid": event["thread"],
+                "args": {
+                    "cpu_s": event["cpu_s"],
+                    "peak_bytes": event["peak_bytes"],
+                    "net_bytes": event["net_bytes"],
+                    **event["args"]
+                },
+            }
+            for event in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+    
+    def write(self, path: str, trace_format: str = "jsonl") -> None:
+        """
+        Write the recorded steps in the given format.
+        
+        Args:
+            path (str): Path of the trace file
+            trace_format (str): 'jsonl' or 'chrome'
+        """
+        if trace_format == "chrome":
+            self.write_chrome_trace(path)
+        elif trace_format == "jsonl":
+            self.write_jsonl(path)
+        else:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+
+def enable_tracing(track_memory: bool = True) -> Tracer:
+    """
+    Start recording pipeline steps.
+    
+    Args:
+        track_memory (bool): Whether to record memory allocated by each step
+    
+    Returns:
+        Tracer: The tracer that span() now records into
+    """
+    global _active_tracer
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _active_tracer = Tracer(track_memory=track_memory)
+    return _active_tracer
+
+def disable_tracing() -> Tracer | None:
+    """
+    Stop recording pipeline steps.
+    
+    Returns:
+        Tracer | None: The tracer that was active, with its recorded events
+    """
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    if tracer is not None and tracer.track_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return tracer
+
+def span(name: str, **args):
+    """
+    Record a step in the active tracer; does nothing when tracing is off.
+    
+    Args:
+        name (str): Name of the step
+        **args: Extra details stored with the event
+    
+    Returns:
+        A context manager wrapping the step
+    """
+    if _active_tracer is None:
+        return contextlib.nullcontext()
+    return _active_tracer.span(name, **args)
@@ -1,27 +1,190 @@
-import seaborn as sns
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-import sklearn as sk
+import argparse
+import sys
+from typing import TYPE_CHECKING
 
-from visualization_class import CollegeVisualizer
 from feature_engineering_class import FeatureEngineer
+from pipeline_cache import PipelineCache
+from export_targets import DEFAULT_EXPORTS, EXPORT_TARGETS
+from instrumentation import disable_tracing, enable_tracing, span
 
-def main():
-    """Main script that executes feature engineering and visualizations."""
+# Plotting libraries are imported only by the commands that draw figures
+if TYPE_CHECKING:
+    from visualization_class import CollegeVisualizer
+
+def run_engineering(
+    dataset_path: str = 'datasets/dataset.csv',
+    engineered_path: str | None = 'datasets/engineered_data.csv',
+    cache: PipelineCache | None = None
+) -> FeatureEngineer:
+    """
+    Run feature engineering and optionally save the engineered dataset.
+    
+    Args:
+        dataset_path (str): Path to the input dataset
+        engineered_path (str | None): Where to save the engineered dataset,
+            or None to skip saving it
+        cache (PipelineCache | None): Cache used to skip feature engineering
+            when the input has not changed
     
-    # Feature Engineering
+    Returns:
+        FeatureEngineer: The engineer holding the engineered data
+    """
     print("Starting feature engineering...")
-    engineer = FeatureEngineer('datasets/dataset.csv')
-    engineer.engineer_all_features()
-    engineer.save_engineered_data()
+    with span("feature_engineering"):
+        engineer = FeatureEngineer(dataset_path)
+        engineer.engineer_all_features(cache=cache)
+        if engineered_path is not None:
+            engineer.save_engineered_data(engineered_path)
     print("Feature engineering completed!\n")
+    return engineer
+
+def run_visualization(
+    data: str | FeatureEngineer = 'datasets/engineered_data.csv',
+    output_dir: str = "figures",
+    workers: int | None = 1,
+    cache: PipelineCache | None = None,
+    exports: tuple = DEFAULT_EXPORTS
+) -> "CollegeVisualizer":
+    """
+    Render every chart from an engineered dataset file or an engineer.
+    
+    Args:
+        data (str | FeatureEngineer): Path to the engineered dataset, or a
+            FeatureEngineer whose data is used in place
+        output_dir (str): Directory the figures are saved to
+        workers (int | None): Number of worker processes used for rendering
+        cache (PipelineCache | None): Cache used to skip figures whose inputs
+            have not changed
+        exports (tuple): Export tiers each figure is written to (e.g., ('preview',))
+    
+    Returns:
+        CollegeVisualizer: The visualizer that rendered the charts
+    """
+    from visualization_class import CollegeVisualizer
     
-    # Visualization
     print("Starting visualizations...")
-    visualizer = CollegeVisualizer("datasets/engineered_data.csv")
-    visualizer.create_all_visualizations()
+    with span("visualization"):
+        visualizer = CollegeVisualizer(data, output_dir=output_dir, exports=exports)
+        visualizer.create_all_visualizations(workers=workers, cache=cache)
     print("Visualizations completed!")
+    return visualizer
+
+def run_pipeline(
+    dataset_path: str = 'datasets/dataset.csv',
+    engineered_path: str | None = 'datasets/engineered_data.csv',
+    workers: int | None = 1,
+    cache: PipelineCache | None = None,
+    exports: tuple = DEFAULT_EXPORTS,
+    output_dir: str = "figures"
+) -> "CollegeVisualizer":
+    """
+    Run feature engineering and visualizations with the data kept in memory.
+    
+    The engineered dataframe is handed straight to the visualizer; saving it
+    to disk is only a side output and is never read back.
+    
+    Args:
+        dataset_path (str): Path to the input dataset
+        engineered_path (str | None): Where to save the engineered dataset,
+            or None to skip saving it
+        workers (int | None): Number of worker processes used for rendering
+        cache (PipelineCache | None): Cache used to skip feature engineering
+            and figures whose inputs have not changed
+        exports (tuple): Export tiers each figure is written to (e.g., ('preview',))
+        output_dir (str): Directory the figures are saved to
+    
+    Returns:
+        CollegeVisualizer: The visualizer built from the engineered data
+    """
+    engineer = run_engineering(dataset_path, engineered_path, cache=cache)
+    return run_visualization(engineer, output_dir=output_dir, workers=workers, cache=cache, exports=exports)
+
+# Subcommands accepted by main
+COMMANDS = ("engineer", "visualize", "run")
+
+def _add_trace_options(parser: argparse.ArgumentParser, with_defaults: bool = True) -> None:
+    """
+    Add the tracing options to a parser.
+    
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+        with_defaults (bool): Whether unset options get defaults; commands
+            leave them unset so they never overwrite options given before the command
+    """
+    def default(value):
+        return value if with_defaults else argparse.SUPPRESS
+    
+    parser.add_argument("--trace", default=default(None),
+                        help="Write a per-step timing and memory trace to this file")
+    parser.add_argument("--trace-format", default=default("jsonl"), choices=["jsonl", "chrome"],
+                        help="Trace format: JSON lines or Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument("--no-trace-memory", action="store_true", default=default(False),
+                        help="Skip memory tracking in the trace, which lowers its overhead")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser with the engineer, visualize and run commands."""
+    parser = argparse.ArgumentParser(description="Run feature engineering and visualizations.")
+    _add_trace_options(parser)
+    trace_options = argparse.ArgumentParser(add_help=False)
+    _add_trace_options(trace_options, with_defaults=False)
+    
+    cache_options = argparse.ArgumentParser(add_help=False, parents=[trace_options])
+    cache_options.add_argument("--cache", metavar="DIR",
+                               help="Cache engineered data and figures in this directory")
+    render_options = argparse.ArgumentParser(add_help=False)
+    render_options.add_argument("--figures", default="figures", help="Directory the figures are saved to")
+    render_options.add_argument("--workers", type=int, default=1,
+                                help="Worker processes used for rendering; 0 uses one per CPU")
+    render_options.add_argument("--exports", nargs="+", default=list(DEFAULT_EXPORTS), choices=list(EXPORT_TARGETS),
+                                help="Export tiers to write; 'preview' alone skips the full-resolution PNGs")
+    
+    commands = parser.add_subparsers(dest="command", metavar="{engineer,visualize,run}",
+                                     help="Defaults to run when omitted")
+    engineer = commands.add_parser("engineer", parents=[cache_options],
+                                   help="Engineer features and save them; never loads plotting libraries")
+    engineer.add_argument("--input", default="datasets/dataset.csv", help="Input dataset")
+    engineer.add_argument("--output", default="datasets/engineered_data.csv", help="Where to save the engineered dataset")
+    
+    visualize = commands.add_parser("visualize", parents=[cache_options, render_options],
+                                    help="Render the charts from an engineered dataset")
+    visualize.add_argument("--input", default="datasets/engineered_data.csv", help="Engineered dataset")
+    
+    run = commands.add_parser("run", parents=[cache_options, render_options],
+                              help="Engineer features and render the charts in one process")
+    run.add_argument("--input", default="datasets/dataset.csv", help="Input dataset")
+    run.add_argument("--output", default="datasets/engineered_data.csv", help="Where to save the engineered dataset")
+    run.add_argument("--no-save", action="store_true", help="Keep the engineered dataset in memory only")
+    return parser
+
+def main(argv: list | None = None):
+    """Main script that executes feature engineering and visualizations."""
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Without a command, every option belongs to run, as in 'main.py --exports preview'
+    if not any(arg in COMMANDS for arg in argv) and not {"-h", "--help"} & set(argv):
+        argv = ["run"] + argv
+    args = parser.parse_args(argv)
+    
+    cache = PipelineCache(args.cache) if args.cache else None
+    if args.trace:
+        enable_tracing(track_memory=not args.no_trace_memory)
+    try:
+        if args.command == "engineer":
+            run_engineering(args.input, args.output, cache=cache)
+        elif args.command == "visualize":
+            run_visualization(args.input, args.figures, args.workers or None, cache, tuple(args.exports))
+        else:
+            run_pipeline(
+                args.input,
+                None if args.no_save else args.output,
+                workers=args.workers or None,
+                cache=cache,
+                exports=tuple(args.exports),
+                output_dir=args.figures
+            )
+    finally:
+        if args.trace:
+            disable_tracing().write(args.trace, args.trace_format)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,247 @@
+import pickle
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.neighbors import BallTree, KDTree
+from data_io import read_dataset
+from feature_engineering_class import FeatureEngineer, PERIOD_COLUMNS
+from pipeline_cache import PipelineCache, hash_dataframe, hash_values
+
+# Features colleges are compared on when looking up peers
+PEER_FEATURES = ("admission_rate", "graduate_rate_4yr", "graduate_rate_6yr", "tuition_cost", "cohort_size")
+
+# Tree types that can back the index
+TREES = {"kd_tree": KDTree, "ball_tree": BallTree}
+
+def select_period(dataset: pd.DataFrame, period=None) -> pd.DataFrame:
+    """
+    Keep one period of a dataset, so every college appears once.
+    
+    Args:
+        dataset (pd.DataFrame): Dataset with a 'colleges' column and, for
+            multi-period data, one of PERIOD_COLUMNS
+        period: Value of the period column to keep, e.g. 2023; None keeps every row
+    
+    Returns:
+        pd.DataFrame: The selected rows
+    
+    Raises:
+        ValueError: If a period is given but the dataset has no period column
+            or no rows for it, or if college names still repeat
+    """
+    period_columns = [column for column in PERIOD_COLUMNS if column in dataset.columns]
+    if period is not None:
+        if not period_columns:
+            raise ValueError(f"Dataset has no period column ({', '.join(PERIOD_COLUMNS)}) to select {period!r} from.")
+        dataset = dataset[dataset[period_columns[0]].astype(str) == str(period)]
+        if dataset.empty:
+            raise ValueError(f"Dataset has no rows with {period_columns[0]} {period!r}.")
+    
+    repeated = dataset["colleges"][dataset["colleges"].duplicated()].unique()
+    if len(repeated):
+        hint = f"; pass a period to choose one {period_columns[0]}" if period_columns and period is None else ""
+        raise ValueError(f"College names repeat in the peer dataset, e.g. {list(repeated[:3])}{hint}.")
+    return dataset
+
+class PeerIndex:
+    """A class to find the colleges most similar to others on standardized features."""
+    
+    def __init__(
+        self,
+        dataset: str | pd.DataFrame | FeatureEngineer,
+        features: tuple = PEER_FEATURES,
+        algorithm: str = "kd_tree",
+        leaf_size: int = 40,
+        period=None
+    ):
+        """
+        Build the index.
+        
+        Each feature is standardized to zero mean and unit variance, so no
+        feature dominates the distance because of its units. Colleges missing
+        any feature are left out of the index. Peers are looked up by college
+        name, so multi-period data must be narrowed to one period.
+        
+        Args:
+            dataset (str | pd.DataFrame | FeatureEngineer): Path to the engineered
+                dataset file, a dataframe, or a FeatureEngineer whose dataframe is indexed
+            features (tuple): Columns colleges are compared on
+            algorithm (str): 'kd_tree' or 'ball_tree'
+            leaf_size (int): Leaf size of the tree
+            period: Period to index from multi-period data (see select_period),
+                or None when every college appears once
+        """
+        if isinstance(dataset, FeatureEngineer):
+            dataset = dataset.get_dataframe()
+        if not isinstance(dataset, pd.DataFrame):
+            dataset = read_dataset(dataset, columns=["colleges", *features, *PERIOD_COLUMNS])
+        if algorithm not in TREES:
+            raise ValueError(f"Unknown tree algorithm: {algorithm}")
+        dataset = select_period(dataset, period)
+        
+        values = dataset[list(features)].to_numpy(dtype="float64", na_value=np.nan)
+        complete = ~np.isnan(values).any(axis=1)
+        values = values[complete]
+        self.features = tuple(features)
+        self.algorithm = algorithm
+        self.period = period
+        self.colleges = dataset["colleges"].to_numpy(dtype=object)[complete]
+        self.mean = values.mean(axis=0) if len(values) else np.zeros(len(features))
+        std = values.std(axis=0) if len(values) else np.ones(len(features))
+        # Constant features carry no distance information; avoid dividing by zero
+        self.scale = np.where(std > 0, std, 1.0)
+        self.tree = TREES[algorithm]((values - self.mean) / self.scale, leaf_size=leaf_size)
+        self._positions = pd.Index(self.colleges)
+    
+    def __len__(self) -> int:
+        """Return the number of indexed colleges."""
+        return len(self.colleges)
+    
+    def query(self, values: pd.DataFrame | np.ndarray, k: int = 5) -> tuple:
+        """
+        Find the nearest indexed colleges to arbitrary feature values.
+        
+        Args:
+            values (pd.DataFrame | np.ndarray): One row per query, with the
+                index features as columns (in order, for an array)
+            k (int): Number of neighbours per query
+        
+        Returns:
+            tuple: Distances and college names, each of shape (queries, k),
+                nearest first; distances are in standard deviations
+        """
+        if isinstance(values, pd.DataFrame):
+            values = values[list(self.features)].to_numpy(dtype="float64")
+        points = (np.atleast_2d(values) - self.mean) / self.scale
+        distances, positions = self.tree.query(points, k=min(k, len(self)))
+        return distances, self.colleges[positions]
+    
+    def peers(self, colleges: str | list, k: int = 5) -> pd.DataFrame:
+        """
+        Find the k most similar colleges to each of a batch of indexed colleges.
+        
+        All colleges are queried against the tree in one call; each college
+        is excluded from its own peers.
+        
+        Args:
+            colleges (str | list): College name or names to find peers for
+            k (int): Number of peers per college
+        
+        Returns:
+            pd.DataFrame: Columns 'college', 'rank' (1 is nearest), 'peer' and
+                'distance' (in standard deviations), k rows per college
+        """
+        names = [colleges] if isinstance(colleges, str) else list(colleges)
+        positions = self._positions.get_indexer(names)
+        if (positions < 0).any():
+            missing = [name for name, position in zip(names, positions) if position < 0]
+            raise KeyError(f"Colleges not in the peer index: {missing}")
+        
+        k = min(k, len(self) - 1)
+        points = np.asarray(self.tree.data)[positions]
+        distances, neighbours = self.tree.query(points, k=k + 1)
+        # Drop each college from its own results; if a duplicate hid it, drop the farthest instead
+        not_self = neighbours != positions[:, None]
+        keep = np.argsort(~not_self, axis=1, kind="stable")[:, :k]
+        distances = np.take_along_axis(distances, keep, axis=1)
+        neighbours = np.take_along_axis(neighbours, keep, axis=1)
+        return pd.DataFrame({
+            "college": np.repeat(np.asarray(names, dtype=object), k),
+            "rank": np.tile(np.arange(1, k + 1), len(names)),
+            "peer": self.colleges[neighbours.ravel()],
+            "distance": distances.ravel(),
+        })
+    
+    def save(self, path: str) -> None:
+        """
+        Save the index so later processes can load it instead of rebuilding it.
+        
+        Args:
+            path (str): File to write
+        """
+        with open(path, "wb") as f:
+            pickle.dump({"sklearn": sklearn.__version__, "index": self}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: str) -> "PeerIndex":
+        """
+        Load an index written by save.
+        
+        Only load files you created; the index is stored with pickle.
+        
+        Args:
+            path (str): File to read
+        
+        Returns:
+            PeerIndex: The saved index
+        """
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if saved["sklearn"] != sklearn.__version__:
+            raise ValueError(
+                f"Peer index was saved with scikit-learn {saved['sklearn']}, "
+                f"but {sklearn.__version__} is installed; rebuild it."
+            )
+        return saved["index"]
+    
+    @classmethod
+    def cached(
+        cls,
+        dataset: str | pd.DataFrame | FeatureEngineer,
+        cache: PipelineCache,
+        features: tuple = PEER_FEATURES,
+        algorithm: str = "kd_tree",
+        period=None
+    ) -> "PeerIndex":
+        """
+        Load the index for a dataset from the cache, building and storing it on a miss.
+        
+        Args:
+            dataset (str | pd.DataFrame | FeatureEngineer): Dataset to index
+            cache (PipelineCache): Cache holding built indexes, keyed by the
+                indexed columns' contents, the features, the algorithm, the
+                period and the scikit-learn version
+            features (tuple): Columns colleges are compared on
+            algorithm (str): 'kd_tree' or 'ball_tree'
+            period: Period to index from multi-period data, or None
+        
+        Returns:
+            PeerIndex: The loaded or newly built index
+        """
+        if isinstance(dataset, FeatureEngineer):
+            dataset = dataset.get_dataframe()
+        if not isinstance(dataset, pd.DataFrame):
+            dataset = read_dataset(dataset, columns=["colleges", *features, *PERIOD_COLUMNS])
+        dataset = select_period(dataset, period)
+        key = hash_values(
+            hash_dataframe(dataset[["colleges", *features]]),
+            features,
+            algorithm,
+            period,
+            sklearn.__version__
+        )
+        cached_path = cache.get(key, ".pkl")
+        if cached_path is not None:
+            return cls.load(cached_path)
+        index = cls(dataset, features=features, algorithm=algorithm, period=period)
+        tmp_path = cache.temp_path(".pkl")
+        index.save(tmp_path)
+        cache.put(key, ".pkl", tmp_path, move=True)
+        return index
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Find the most similar colleges.")
+    parser.add_argument("colleges", nargs="+", help="Colleges to find peers for")
+    parser.add_argument("-k", type=int, default=5, help="Peers per college")
+    parser.add_argument("--input", default="datasets/engineered_data.csv", help="Engineered dataset")
+    parser.add_argument("--cache", default=".cache/pipeline", help="Directory the built index is cached in")
+    parser.add_argument("--period", help="Period to compare within, for data with several years")
+    args = parser.parse_args()
+    
+    try:
+        index = PeerIndex.cached(args.input, PipelineCache(args.cache), period=args.period)
+    except ValueError as error:
+        parser.error(str(error))
+    print(index.peers(args.colleges, k=args.k).to_string(index=False))
@@ -0,0 +1,177 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import pandas as pd
+
+# Scratch files in the cache directory start with this and are never treated as entries
+TEMP_PREFIX = "tmp-"
+
+def hash_values(*parts) -> str:
+    """
+    Hash any number of values into a single cache key.
+    
+    Args:
+        *parts: Values whose string form makes up the key
+    
+    Returns:
+        str: Hex digest of the combined values
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def hash_dataframe(df: pd.DataFrame) -> str:
+    """
+    Hash the contents of a dataframe, including its column names and dtypes.
+    
+    Args:
+        df (pd.DataFrame): Dataframe to hash
+    
+    Returns:
+        str: Hex digest of the dataframe contents
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hash_values(
+        list(df.columns),
+        list(df.dtypes.astype(str)),
+        hashlib.sha256(row_hashes.tobytes()).hexdigest()
+    )
+
+class PipelineCache:
+    """A size-bounded, content-addressed file cache for engineered data and figures."""
+    
+    def __init__(self, cache_dir: str = ".cache/pipeline", max_bytes: int = 512 * 1024 ** 2):
+        """
+        Initialize the PipelineCache.
+        
+        Args:
+            cache_dir (str): Directory holding the cached files
+            max_bytes (int): Total size above which the least recently used
+                entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def path_for(self, key: str, suffix: str) -> str:
+        """
+        Get the path an entry is stored at.
+        
+        Args:
+            key (str): Cache key, e.g. from hash_values
+            suffix (str): File extension of the entry (e.g., '.png')
+        
+        Returns:
+            str: Path of the entry inside the cache directory
+        """
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+    
+    def get(self, key: str, suffix: str) -> str | None:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key (str): Cache key
+            suffix (str): File extension of the entry
+        
+        Returns:
+            str | None: Path of the cached file, or None on a miss
+        """
+        path = self.path_for(key, suffix)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)
+        return path
+    
+    def temp_path(self, suffix: str) -> str:
+        """
+        Create an empty scratch file inside the cache directory.
+        
+        Files written here can be stored with put(move=True) without a copy.
+        
+        Args:
+            suffix (str): File extension, so writers can pick a format from it
+        
+        Returns:
+            str: Path of the scratch file
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=TEMP_PREFIX, suffix=suffix)
+        os.close(fd)
+        return tmp_path
+    
+    def put(self, key: str, suffix: str, source_path: str, move: bool = False) -> str:
+        """
+        Store a file in the cache, then evict old entries if over the size limit.
+        
+        Args:
+            key (str): Cache key
+            suffix (str): File extension of the entry
+            source_path (str): File to store
+            move (bool): Move source_path into the cache instead of copying it
+        
+        Returns:
+            str: Path of the cached file
+        """
+        path = self.path_for(key, suffix)
+        # Write then rename so readers never see a partially written entry
+        if move:
+            os.replace(source_path, path)
+        else:
+            tmp_path = self.temp_path(suffix)
+            shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+    
+    def _entries(self) -> list:
+        """Return (path, size, last used time) for every cached file, oldest first."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(TEMP_PREFIX) or not os.path.isfile(path):
+                continue
+            stat = os.stat(path)
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+    
+    def size(self) -> int:
+        """Return the total size of the cached files in bytes."""
+        return sum(size for _, size, _ in self._entries())
+    
+    def _evict(self, keep: str | None = None) -> None:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+        
+        Args:
+            keep (str | None): Path of an entry that must not be evicted
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+    
+    def invalidate(self, key: str | None = None) -> int:
+        """
+        Remove cached entries.
+        
+        Args:
+            key (str | None): Key whose entries should be removed, or None to
+                clear the whole cache
+        
+        Returns:
+            int: Number of files removed
+        """
+        removed = 0
+        for path, _, _ in self._entries():
+            if key is None or os.path.basename(path).startswith(key):
+                os.remove(path)
+                removed += 1
+        return removed
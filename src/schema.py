@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+# Compact dtypes for the dataset columns. Rates and engineered scores are
+# stored with three decimals or fewer, so float32 holds them for storage.
+COLUMN_DTYPES = {
+    "colleges": "category",
+    "application_volume": "int32",
+    "tuition_cost": "int32",
+    "admission_rate": "float32",
+    "graduate_rate_4yr": "float32",
+    "graduate_rate_6yr": "float32",
+    "avg_graduation_rate": "float32",
+    "graduation_rate_improvement": "float32",
+    "selectivity_score": "float32",
+    "cohort_size": "float32",
+}
+
+# Downcasts that keep every value exact. Feature engineering and plotting use
+# only these: float32 inputs can change which way a feature rounds and shift
+# autoscaled axis limits, which moves gridlines in the figures.
+LOSSLESS_DTYPES = {
+    column: dtype for column, dtype in COLUMN_DTYPES.items()
+    if not dtype.startswith("float")
+}
+
+# Column names used by the college_data.csv export, mapped to the names used everywhere else
+COLUMN_ALIASES = {
+    "College": "colleges",
+    "Application Volume (Students)": "application_volume",
+    "Admission Rates": "admission_rate",
+    "Graduation Rate (4 Years)": "graduate_rate_4yr",
+    "Graduation Rate (6 Years)": "graduate_rate_6yr",
+    "Tuition Cost": "tuition_cost",
+}
+
+# Options passed to pd.read_csv so values like "54,008" parse as numbers
+CSV_READ_OPTIONS = {"thousands": ","}
+
+def apply_schema(df: pd.DataFrame, dtypes: dict = COLUMN_DTYPES) -> pd.DataFrame:
+    """
+    Convert the columns of a dataframe to their compact dtypes in place.
+    
+    Columns missing from the schema or from the dataframe are left alone, as
+    are integer columns whose values do not fit the compact type. College
+    names keep their order of appearance as category order.
+    
+    Args:
+        df (pd.DataFrame): Dataframe to convert
+        dtypes (dict): Column name to dtype mapping
+    
+    Returns:
+        pd.DataFrame: The same dataframe, for chaining
+    """
+    for column, dtype in dtypes.items():
+        if column not in df.columns or str(df[column].dtype) == dtype:
+            continue
+        values = df[column]
+        if dtype == "category":
+            df[column] = pd.Categorical(values, categories=values.dropna().unique())
+        elif dtype.startswith("int"):
+            limits = np.iinfo(dtype)
+            if (pd.api.types.is_integer_dtype(values)
+                    and (values.empty or limits.min <= values.min() and values.max() <= limits.max)):
+                df[column] = values.astype(dtype)
+        elif pd.api.types.is_numeric_dtype(values):
+            df[column] = values.astype(dtype)
+    return df
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rename columns from variant exports such as college_data.csv to the standard names.
+    
+    Surrounding whitespace is stripped from every name; names that are
+    neither aliases nor standard are left as they are.
+    
+    Args:
+        df (pd.DataFrame): Dataframe to rename
+    
+    Returns:
+        pd.DataFrame: The dataframe with standard column names
+    """
+    renames = {column: COLUMN_ALIASES.get(str(column).strip(), str(column).strip()) for column in df.columns}
+    return df.rename(columns=renames)
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the per-column memory footprint of two versions of a dataset.
+    
+    Args:
+        before (pd.DataFrame): Dataset loaded with pandas' default dtypes
+        after (pd.DataFrame): The same dataset loaded with the compact schema
+    
+    Returns:
+        pd.DataFrame: One row per column with dtypes and bytes before and
+            after, plus a total row
+    """
+    before_bytes = before.memory_usage(index=False, deep=True)
+    after_bytes = after.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "bytes_before": before_bytes,
+        "dtype_after": after.dtypes.astype(str).reindex(before.columns),
+        "bytes_after": after_bytes.reindex(before.columns),
+    })
+    report.loc["total"] = ["", before_bytes.sum(), "", after_bytes.sum()]
+    report["saved_pct"] = (1 - report["bytes_after"] / report["bytes_before"]).mul(100).round(1)
+    report.index.name = "column"
+    return report
+
+if __name__ == "__main__":
+    import sys
+    from data_io import read_dataset
+    
+    path = sys.argv[1] if len(sys.argv) > 1 else "datasets/engineered_data.csv"
+    default_df = read_dataset(path)
+    compact_df = apply_schema(read_dataset(path))
+    print(memory_report(default_df, compact_df).to_string())
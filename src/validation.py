@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+# Columns holding rates, valid in (0, 1]
+RATE_COLUMNS = ("admission_rate", "graduate_rate_4yr", "graduate_rate_6yr")
+
+# Columns holding counts or amounts, valid when zero or more
+NON_NEGATIVE_COLUMNS = ("application_volume", "tuition_cost")
+
+# Columns of the report returned by validate_dataset
+REPORT_COLUMNS = ["row", "column", "check", "value"]
+
+def _as_numbers(values: pd.Series) -> tuple:
+    """
+    Get the values of a column as floats.
+    
+    Args:
+        values (pd.Series): Column to convert
+    
+    Returns:
+        tuple: Float array (NaN where a value is missing or not a number) and
+            a mask of the values that are present but not numbers
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype="float64", na_value=np.nan), np.zeros(len(values), dtype=bool)
+    numbers = pd.to_numeric(values.astype(str).str.replace(",", ""), errors="coerce")
+    numbers = numbers.to_numpy(dtype="float64", na_value=np.nan)
+    return numbers, np.isnan(numbers) & values.notna().to_numpy()
+
+def validate_dataset(df: pd.DataFrame, key_columns: list | None = None) -> pd.DataFrame:
+    """
+    Check a dataset in one vectorized pass and report every problem found.
+    
+    Every column is checked for missing values, rates for values outside
+    (0, 1], volumes and tuition for negative values, and the key columns for
+    duplicates. Expected columns absent from the dataset are reported too,
+    so a file with unrecognised column names never passes as clean.
+    Nothing is raised; each problem becomes one report row.
+    
+    Args:
+        df (pd.DataFrame): Dataset to check
+        key_columns (list | None): Columns that identify a college; defaults to ['colleges']
+    
+    Returns:
+        pd.DataFrame: One row per problem with the row label, column, check
+            ('missing_column', 'null', 'not_numeric', 'out_of_range' or
+            'duplicate') and the offending value; missing columns come first
+            with no row label, then the rest in row order; empty when the
+            dataset is valid
+    """
+    if key_columns is None:
+        key_columns = ["colleges"]
+    expected = list(dict.fromkeys([*key_columns, *RATE_COLUMNS, *NON_NEGATIVE_COLUMNS]))
+    missing = [column for column in expected if column not in df.columns]
+    problems = []
+    
+    def record(mask: np.ndarray, column: str, check: str, values: np.ndarray | None) -> None:
+        positions = np.flatnonzero(mask)
+        if len(positions):
+            found = np.full(len(positions), None, dtype=object) if values is None else values[positions]
+            problems.append((positions, column, check, found))
+    
+    nulls = df.isna()
+    for column in df.columns:
+        record(nulls[column].to_numpy(), column, "null", None)
+    
+    for column in RATE_COLUMNS + NON_NEGATIVE_COLUMNS:
+        if column not in df.columns:
+            continue
+        numbers, not_numeric = _as_numbers(df[column])
+        if not_numeric.any():
+            record(not_numeric, column, "not_numeric", df[column].to_numpy(dtype=object))
+        if column in RATE_COLUMNS:
+            out_of_range = (numbers <= 0) | (numbers > 1)
+        else:
+            out_of_range = numbers < 0
+        record(out_of_range, column, "out_of_range", numbers)
+    
+    present_keys = [column for column in key_columns if column in df.columns]
+    if present_keys:
+        # Every row sharing a key is reported, not only the repeats
+        duplicated = df.duplicated(subset=present_keys, keep=False).to_numpy()
+        record(duplicated, ", ".join(present_keys), "duplicate", df[present_keys[0]].to_numpy(dtype=object))
+    
+    missing_report = pd.DataFrame({
+        "row": pd.Series([None] * len(missing), dtype=object),
+        "column": pd.Series(missing, dtype=object),
+        "check": pd.Series(["missing_column"] * len(missing), dtype=object),
+        "value": pd.Series([None] * len(missing), dtype=object),
+    })
+    if not problems:
+        return missing_report
+    positions = np.concatenate([entry[0] for entry in problems])
+    report = pd.DataFrame({
+        "row": df.index.to_numpy()[positions],
+        "column": np.concatenate([np.full(len(entry[0]), entry[1], dtype=object) for entry in problems]),
+        "check": np.concatenate([np.full(len(entry[0]), entry[2], dtype=object) for entry in problems]),
+        "value": np.concatenate([entry[3].astype(object) for entry in problems]),
+    })
+    # Stable sort keeps the checks of each row in the order they ran
+    order = np.argsort(positions, kind="stable")
+    report = report.iloc[order].reset_index(drop=True)
+    if missing:
+        report = pd.concat([missing_report, report], ignore_index=True)
+    return report
+
+if __name__ == "__main__":
+    import sys
+    from data_io import read_dataset
+    from schema import normalize_columns
+    
+    path = sys.argv[1] if len(sys.argv) > 1 else "datasets/dataset.csv"
+    report = validate_dataset(normalize_columns(read_dataset(path)))
+    if report.empty:
+        print("No problems found")
+    else:
+        print(report.to_string())
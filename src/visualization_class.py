@@ -1,288 +1,675 @@
+import inspect
 import pandas as pd
 import seaborn as sns
+import matplotlib
 import matplotlib.pyplot as plt
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pandas.api.types import is_numeric_dtype
+from data_io import read_dataset
+from feature_engineering_class import FeatureEngineer
+from pipeline_cache import PipelineCache, hash_dataframe, hash_values
+from schema import LOSSLESS_DTYPES
+from correlation import CorrelationEngine
+from export_targets import DEFAULT_EXPORTS, EXPORT_TARGETS, ExportTarget
+from instrumentation import span
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    Declarative description of one chart rendered by CollegeVisualizer.
+    
+    Attributes:
+        name (str): Unique chart name, also the output file stem
+        kind (str): Renderer to use: 'scatter', 'dual' or 'heatmap'
+        title (str): Chart title
+        x (str | None): Column on the x-axis (scatter) or drawn as bars (dual)
+        y (str | None): Column on the y-axis (scatter) or drawn as a line (dual)
+        xlabel (str | None): Override for the x-axis label of a scatter chart
+        ylabel (str | None): Override for the y-axis label of a scatter chart
+    """
+    name: str
+    kind: str
+    title: str
+    x: str | None = None
+    y: str | None = None
+    xlabel: str | None = None
+    ylabel: str | None = None
+    
+    @property
+    def filename(self) -> str:
+        """Name of the PNG file the chart is saved to."""
+        return f"{self.name}.png"
+
+# Legend label and axis label for each metric drawn on a dual-axis chart
+METRIC_LABELS = {
+    "tuition_cost": ("Tuition Cost", "Tuition Cost ($)"),
+    "cohort_size": ("Cohort Size", "Cohort Size"),
+    "application_volume": ("Application Volume", "Application Volume"),
+    "graduate_rate_4yr": ("4-Year Graduation Rate", "4-Year Graduation Rate (%)"),
+    "graduate_rate_6yr": ("6-Year Graduation Rate", "6-Year Graduation Rate (%)"),
+}
+
+# Charts rendered by create_all_visualizations, in order
+CHART_SPECS = (
+    ChartSpec("admission_rate_vs_6yr_graduation", "scatter",
+              "Admission Rate vs 6-Year Graduation Rate",
+              x="admission_rate", y="graduate_rate_6yr"),
+    ChartSpec("selectivity_score_vs_4yr_graduation", "scatter",
+              "Selective Score vs 4-Year Graduation Rate",
+              x="selectivity_score", y="graduate_rate_4yr",
+              xlabel="Selectivity Score", ylabel="4-Year Graduation Rate (%)"),
+    ChartSpec("selectivity_score_vs_6yr_graduation", "scatter",
+              "Selective Score vs 6-Year Graduation Rate",
+              x="selectivity_score", y="graduate_rate_6yr",
+              xlabel="Selectivity Score", ylabel="6-Year Graduation Rate (%)"),
+    ChartSpec("admission_rate_vs_4yr_graduation", "scatter",
+              "Admission Rate vs 4-Year Graduation Rate",
+              x="admission_rate", y="graduate_rate_4yr",
+              xlabel="Admission Rate (%)", ylabel="4-Year Graduation Rate (%)"),
+    ChartSpec("tuition_vs_4yr_graduation_dual", "dual",
+              "Tuition Cost vs 4-Year Graduation Rate by College",
+              x="tuition_cost", y="graduate_rate_4yr"),
+    ChartSpec("tuition_vs_6yr_graduation_dual", "dual",
+              "Tuition Cost vs 6-Year Graduation Rate by College",
+              x="tuition_cost", y="graduate_rate_6yr"),
+    ChartSpec("cohort_size_vs_4yr_graduation_dual", "dual",
+              "Cohort Size vs 4-Year Graduation Rate by College",
+              x="cohort_size", y="graduate_rate_4yr"),
+    ChartSpec("cohort_size_vs_6yr_graduation_dual", "dual",
+              "Cohort Size vs 6-Year Graduation Rate by College",
+              x="cohort_size", y="graduate_rate_6yr"),
+    ChartSpec("application_volume_vs_4yr_graduation_dual", "dual",
+              "Application Volume vs 4-Year Graduation Rate by College",
+              x="application_volume", y="graduate_rate_4yr"),
+    ChartSpec("application_volume_vs_6yr_graduation_dual", "dual",
+              "Application Volume vs 6-Year Graduation Rate by College",
+              x="application_volume", y="graduate_rate_6yr"),
+    ChartSpec("correlation_heatmap", "heatmap",
+              "Correlation Heatmap of College Metrics"),
+)
+
+# Row count above which charts switch to the large-dataset rendering mode
+LARGE_DATASET_ROWS = 500
+
+# Colleges highlighted by name on large-dataset scatter plots
+TOP_K_COLLEGES = 10
+
+# Hexagons across the x-axis of large-dataset scatter plots
+HEXBIN_GRIDSIZE = 40
+
+# Quantile bins drawn on large-dataset dual-axis charts
+DUAL_AXIS_BINS = 20
+
+# Metric count above which the heatmap drops cell annotations, is rasterized
+# and orders metrics by correlation clusters
+HEATMAP_ANNOTATION_LIMIT = 20
+
+# Input columns needed to derive columns missing from the dataset
+DERIVED_COLUMN_INPUTS = {
+    "selectivity_score": ("admission_rate",),
+    "cohort_size": ("application_volume", "admission_rate"),
+}
+
+def columns_for_charts(specs) -> list | None:
+    """
+    Find the dataset columns needed to render a set of charts.
+    
+    Args:
+        specs: Iterable of ChartSpec objects
+    
+    Returns:
+        list | None: Column names to load, or None when a chart needs every column
+    """
+    columns = ["colleges"]
+    for spec in specs:
+        if spec.kind == "heatmap":
+            return None
+        for column in (spec.x, spec.y):
+            if column is None:
+                continue
+            columns.append(column)
+            columns.extend(DERIVED_COLUMN_INPUTS.get(column, ()))
+    return list(dict.fromkeys(columns))
+
+# Visualizer shared by the charts rendered in a worker process
+_worker_visualizer = None
+
+def _init_render_worker(visualizer: "CollegeVisualizer") -> None:
+    """
+    Prepare a worker process for rendering figures.
+    
+    Args:
+        visualizer (CollegeVisualizer): Visualizer whose charts the worker renders
+    """
+    global _worker_visualizer
+    plt.switch_backend("Agg")
+    visualizer._set_theme()
+    _worker_visualizer = visualizer
+
+def _render_charts(chart_names: list) -> list:
+    """
+    Render a batch of charts in a worker process.
+    
+    Args:
+        chart_names (list): Names of the registered charts to render
+    
+    Returns:
+        list: The chart names, once every figure has been saved
+    """
+    with _worker_visualizer:
+        for name in chart_names:
+            _worker_visualizer.render_chart(name)
+    return chart_names
 
 class CollegeVisualizer:
     """A class to handle visualization of college datasets."""
     
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str | pd.DataFrame | FeatureEngineer,
+        columns: list | None = None,
+        output_dir: str = "figures",
+        large_threshold: int | None = LARGE_DATASET_ROWS,
+        exports: tuple = DEFAULT_EXPORTS
+    ):
         """
         Initialize the CollegeVisualizer with a dataset.
         
+        Files are loaded with the lossless compact dtypes from schema.py, so
+        plotted values match the file exactly. A dataframe or FeatureEngineer
+        is used in place, without a copy, a dtype change or a round-trip
+        through disk; only a row slice whose categorical college names still
+        list colleges outside the slice is copied, with those categories dropped.
+        
         Args:
-            file_path (str): Path to the CSV dataset file
+            file_path (str | pd.DataFrame | FeatureEngineer): Path to the dataset
+                file (CSV, Parquet or Feather), a dataframe, or a FeatureEngineer
+                whose dataframe should be plotted
+            columns (list | None): Columns to load, e.g. from columns_for_charts;
+                None loads every column
+            output_dir (str): Directory the figures are saved to
+            large_threshold (int | None): Row count above which scatter plots are
+                drawn as hexbin densities with the top colleges highlighted and
+                dual-axis charts are binned; None always draws every college
+            exports (tuple): Tier names from EXPORT_TARGETS or ExportTarget
+                objects; each figure is laid out once and written to every
+                target, so ('preview',) skips the 300 dpi rasterization entirely
         """
-        self.df = pd.read_csv(file_path)
+        if isinstance(file_path, FeatureEngineer):
+            file_path = file_path.get_dataframe()
+        if isinstance(file_path, pd.DataFrame):
+            if columns is not None:
+                wanted = set(columns)
+                file_path = file_path.drop(columns=[column for column in file_path.columns if column not in wanted])
+            # Row slices keep every parent category, which would put absent colleges in legends
+            colleges = file_path["colleges"] if "colleges" in file_path.columns else None
+            if colleges is not None and isinstance(colleges.dtype, pd.CategoricalDtype):
+                if len(colleges.cat.categories) > colleges.nunique():
+                    file_path = file_path.assign(colleges=colleges.cat.remove_unused_categories())
+            self.df = file_path
+        else:
+            self.df = read_dataset(file_path, columns=columns, dtypes=LOSSLESS_DTYPES)
+        self.output_dir = output_dir
+        self.large_threshold = large_threshold
+        self.exports = tuple(
+            EXPORT_TARGETS[target] if isinstance(target, str) else target
+            for target in exports
+        )
+        self.chart_specs = {spec.name: spec for spec in CHART_SPECS}
+        self._open_figures = []
+        self._scope_depth = 0
+        self._dual_layouts = {}
+        self._correlations = None
         self._preprocess_data()
         self._set_theme()
     
+    def __enter__(self) -> "CollegeVisualizer":
+        """
+        Enter a figure scope.
+        
+        Inside a scope, dual-axis charts that share a college ordering reuse
+        one figure; figures still open when the outermost scope exits are released.
+        """
+        self._scope_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release every figure created through this visualizer when the outermost scope exits."""
+        self._scope_depth -= 1
+        if self._scope_depth == 0:
+            self.release_figures()
+    
+    def __getstate__(self) -> dict:
+        """Drop open figure handles when the visualizer is sent to a worker."""
+        state = self.__dict__.copy()
+        state["_open_figures"] = []
+        state["_scope_depth"] = 0
+        state["_dual_layouts"] = {}
+        return state
+    
     def _preprocess_data(self) -> None:
-        """Preprocess the data by cleaning application volume column."""
-        self.df["application_volume"] = (
-            self.df["application_volume"].astype(str)
-            .str.replace(",", "")
-            .astype(int)
-        )
+        """Preprocess the data by cleaning application volume and adding missing derived columns."""
+        columns = self.df.columns
+        # Typed inputs (Parquet, Feather or clean CSV) skip the string round-trip
+        if "application_volume" in columns and not is_numeric_dtype(self.df["application_volume"]):
+            self.df["application_volume"] = (
+                self.df["application_volume"].astype(str)
+                .str.replace(",", "")
+                .astype(int)
+            )
+        if "selectivity_score" not in columns and "admission_rate" in columns:
+            self.df["selectivity_score"] = 1 / self.df["admission_rate"]
+        if "cohort_size" not in columns and {"application_volume", "admission_rate"} <= set(columns):
+            self.df["cohort_size"] = self.df["application_volume"] * self.df["admission_rate"]
+    
+    @property
+    def large_mode(self) -> bool:
+        """Whether charts are drawn in the large-dataset rendering mode."""
+        return self.large_threshold is not None and len(self.df) > self.large_threshold
     
     def _set_theme(self) -> None:
         """Set the seaborn theme and palette."""
         sns.set_theme(style="whitegrid", palette="muted")
     
-    def _save_figure(self, filename: str) -> None:
+    def _create_figure(self, figsize: tuple) -> plt.Figure:
+        """
+        Create a figure that this visualizer tracks until it is released.
+        
+        Args:
+            figsize (tuple): Figure size in inches (width, height)
+        
+        Returns:
+            plt.Figure: The new figure, which is also made current
+        """
+        fig = plt.figure(figsize=figsize)
+        self._open_figures.append(fig)
+        return fig
+    
+    def _create_subplots(self, figsize: tuple) -> tuple:
         """
-        Save the current figure to the figures directory.
+        Create a tracked figure with a single set of axes.
         
         Args:
-            filename (str): Name of the file to save (e.g., 'plot_name.png')
+            figsize (tuple): Figure size in inches (width, height)
+        
+        Returns:
+            tuple: The new figure and its axes
+        """
+        fig = self._create_figure(figsize=figsize)
+        return fig, fig.add_subplot()
+    
+    def _release_figure(self, fig: plt.Figure) -> None:
+        """
+        Close a figure and remove it from pyplot's figure registry.
+        
+        Args:
+            fig (plt.Figure): Figure to release
         """
+        plt.close(fig)
+        if fig in self._open_figures:
+            self._open_figures.remove(fig)
+    
+    def release_figures(self) -> None:
+        """Release every figure created through this visualizer that is still open."""
+        for fig in list(self._open_figures):
+            self._release_figure(fig)
+        self._dual_layouts.clear()
+    
+    def export_path(self, spec: ChartSpec, target: ExportTarget) -> str:
+        """
+        Get the path a chart is exported to for one target.
+        
+        Args:
+            spec (ChartSpec): Chart being exported
+            target (ExportTarget): Export target
+        
+        Returns:
+            str: Path of the exported file
+        """
+        return os.path.join(self.output_dir, target.subdir, target.filename(spec.name))
+    
+    def _save_figure(self, spec: ChartSpec, release: bool = True) -> None:
+        """
+        Save the current figure to every export target, then release it.
+        
+        Args:
+            spec (ChartSpec): Chart the figure was drawn for
+            release (bool): Whether to close the figure once it is saved
+        """
+        fig = plt.gcf()
         plt.tight_layout()
-        os.makedirs("figures", exist_ok=True)
-        plt.savefig(f"figures/{filename}", dpi=300)
+        try:
+            for target in self.exports:
+                path = self.export_path(spec, target)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with span("savefig", filename=target.filename(spec.name), target=target.name):
+                    plt.savefig(path, dpi=target.dpi)
+        finally:
+            if release:
+                self._release_figure(fig)
+    
+    def register_chart(self, spec: ChartSpec) -> None:
+        """
+        Add a chart to the set rendered by create_all_visualizations.
+        
+        Args:
+            spec (ChartSpec): Chart to register; replaces any chart with the same name
+        """
+        self.chart_specs[spec.name] = spec
+    
+    def render_chart(self, chart: str | ChartSpec) -> None:
+        """
+        Render a single chart and save it to the output directory.
+        
+        Args:
+            chart (str | ChartSpec): Registered chart name or a chart spec
+        """
+        spec = self.chart_specs[chart] if isinstance(chart, str) else chart
+        renderers = {
+            "scatter": self._render_scatter,
+            "dual": self._render_dual,
+            "heatmap": self._render_heatmap,
+        }
+        if spec.kind not in renderers:
+            raise ValueError(f"Unknown chart kind: {spec.kind}")
+        with span(f"chart:{spec.name}", kind=spec.kind):
+            renderers[spec.kind](spec)
+    
+    def correlations(self) -> CorrelationEngine:
+        """Return the correlation engine for the numeric columns, created once and reused."""
+        if self._correlations is None:
+            self._correlations = CorrelationEngine(self.df)
+        return self._correlations
     
-    def plot_correlation_heatmap(self) -> None:
+    def _render_heatmap(self, spec: ChartSpec) -> None:
         """Create a correlation heatmap of numeric columns."""
-        plt.figure(figsize=(8, 5))
+        correlations = self.correlations()
+        wide = len(correlations.columns) > HEATMAP_ANNOTATION_LIMIT
+        self._create_figure(figsize=(8, 5))
         sns.heatmap(
-            self.df.select_dtypes(include='number').corr(),
-            annot=True,
+            correlations.clustered_matrix() if wide else correlations.matrix(),
+            annot=not wide,
             cmap="coolwarm",
-            fmt=".2f"
+            fmt=".2f",
+            rasterized=wide
         )
-        plt.title("Correlation Heatmap of College Metrics")
-        self._save_figure("correlation_heatmap.png")    
-
-    def plot_selectivity_score_vs_4yr_graduation(self) -> None:
-        """Create a scatter plot of selectivity score vs 4-year graduation rate."""
-        if "selectivity_score" not in self.df.columns:
-            self.df["selectivity_score"] = 1 / self.df["admission_rate"]
-        
-        plt.figure(figsize=(10, 6))
+        plt.title(spec.title)
+        self._save_figure(spec)
+    
+    def _render_scatter(self, spec: ChartSpec) -> None:
+        """Create a scatter plot of two metrics, colored by college."""
+        if self.large_mode:
+            self._render_density_scatter(spec)
+            return
+        self._create_figure(figsize=(10, 6))
         sns.scatterplot(
-            x="selectivity_score",
-            y="graduate_rate_4yr",
+            x=spec.x,
+            y=spec.y,
             hue="colleges",
             data=self.df,
             s=100
         )
-        plt.title("Selective Score vs 4-Year Graduation Rate")
-        plt.xlabel("Selectivity Score")
-        plt.ylabel("4-Year Graduation Rate (%)")
+        plt.title(spec.title)
+        if spec.xlabel is not None:
+            plt.xlabel(spec.xlabel)
+        if spec.ylabel is not None:
+            plt.ylabel(spec.ylabel)
         plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-        self._save_figure("selectivity_score_vs_4yr_graduation.png")
+        self._save_figure(spec)
     
-    def plot_selectivity_score_vs_6yr_graduation(self) -> None:
-        """Create a scatter plot of selectivity score vs 6-year graduation rate."""
-        if "selectivity_score" not in self.df.columns:
-            self.df["selectivity_score"] = 1 / self.df["admission_rate"]
+    def _render_density_scatter(self, spec: ChartSpec) -> None:
+        """
+        Create a hexbin density of two metrics with the top colleges highlighted.
         
-        plt.figure(figsize=(10, 6))
-        sns.scatterplot(
-            x="selectivity_score",
-            y="graduate_rate_6yr",
-            hue="colleges",
-            data=self.df,
-            s=100
+        Used above the large-dataset threshold, where one color and legend
+        entry per college is unreadable. The drawing cost depends on the grid
+        size and TOP_K_COLLEGES, not on the number of colleges.
+        """
+        points = self.df[["colleges", spec.x, spec.y]].dropna(subset=[spec.x, spec.y])
+        fig, ax = self._create_subplots(figsize=(10, 6))
+        density = ax.hexbin(
+            points[spec.x],
+            points[spec.y],
+            gridsize=HEXBIN_GRIDSIZE,
+            cmap="Blues",
+            mincnt=1
         )
-        plt.title("Selective Score vs 6-Year Graduation Rate")
-        plt.xlabel("Selectivity Score")
-        plt.ylabel("6-Year Graduation Rate (%)")
-        plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-        self._save_figure("selectivity_score_vs_6yr_graduation.png")
-    
-    def plot_admission_rate_vs_6yr_graduation(self) -> None:
-        """Create a scatter plot of admission rate vs 6-year graduation rate."""
-        plt.figure(figsize=(10, 6))
+        density.set_rasterized(True)
+        fig.colorbar(density, ax=ax, label="Colleges")
+        
+        # Plain strings so the legend lists only the highlighted colleges, not every category
+        top = points.nlargest(TOP_K_COLLEGES, spec.y)
+        top = top.assign(colleges=top["colleges"].astype(str))
         sns.scatterplot(
-            x="admission_rate",
-            y="graduate_rate_6yr",
+            x=spec.x,
+            y=spec.y,
             hue="colleges",
-            data=self.df,
-            s=100
+            data=top,
+            s=100,
+            ax=ax,
+            rasterized=True
         )
-        plt.title("Admission Rate vs 6-Year Graduation Rate")
-        plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-        self._save_figure("admission_rate_vs_6yr_graduation.png")
+        ax.set_title(f"{spec.title} ({len(points):,} colleges, top {len(top)} highlighted)")
+        ax.set_xlabel(spec.xlabel if spec.xlabel is not None else spec.x)
+        ax.set_ylabel(spec.ylabel if spec.ylabel is not None else spec.y)
+        ax.legend(bbox_to_anchor=(1.25, 1), loc="upper left")
+        self._save_figure(spec)
     
-    def plot_admission_rate_vs_4yr_graduation(self) -> None:
-        """Create a scatter plot of admission rate vs 4-year graduation rate."""
-        plt.figure(figsize=(10, 6))
-        sns.scatterplot(
-            x="admission_rate",
-            y="graduate_rate_4yr",
-            hue="colleges",
-            data=self.df,
-            s=100
-        )
-        plt.title("Admission Rate vs 4-Year Graduation Rate")
-        plt.xlabel("Admission Rate (%)")
-        plt.ylabel("4-Year Graduation Rate (%)")
-        plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-        self._save_figure("admission_rate_vs_4yr_graduation.png")
-
-    def plot_tuition_vs_4yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of tuition cost vs 4-year graduation rate by college."""
-        num_colleges = len(self.df)
-        figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
-        
-        ax1.set_xlabel("College")
-        ax1.set_ylabel("Tuition Cost ($)", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["tuition_cost"], color="tab:blue", alpha=0.7, label="Tuition Cost")
-        ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+    def _dual_layout(self) -> dict:
+        """
+        Build the figure shared by dual-axis charts for the current college ordering.
         
-        ax2 = ax1.twinx()
-        ax2.set_ylabel("4-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_4yr"], color="tab:orange", marker="o", linewidth=2, label="4-Year Graduation Rate")
-        ax2.tick_params(axis="y", labelcolor="tab:orange")
+        The figure size, college tick labels, twin axes, bars and line are
+        created once; each chart then only swaps in its own values and labels.
         
-        plt.title("Tuition Cost vs 4-Year Graduation Rate by College")
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("tuition_vs_4yr_graduation_dual.png") 
-    
-    def plot_tuition_vs_6yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of tuition cost vs 6-year graduation rate by college."""
+        Returns:
+            dict: The figure, both axes, the bar container and the line
+        """
+        colleges = self.df["colleges"]
         num_colleges = len(self.df)
         figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
+        fig, ax1 = self._create_subplots(figsize=figsize)
         
         ax1.set_xlabel("College")
-        ax1.set_ylabel("Tuition Cost ($)", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["tuition_cost"], color="tab:blue", alpha=0.7, label="Tuition Cost")
+        bars = ax1.bar(colleges, [0] * num_colleges, color="tab:blue", alpha=0.7)
         ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+        ax1.set_xticks(range(num_colleges))
+        ax1.set_xticklabels(colleges, rotation=45, ha="right")
         
         ax2 = ax1.twinx()
-        ax2.set_ylabel("6-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_6yr"], color="tab:orange", marker="o", linewidth=2, label="6-Year Graduation Rate")
+        line, = ax2.plot(colleges, [0] * num_colleges, color="tab:orange", marker="o", linewidth=2)
         ax2.tick_params(axis="y", labelcolor="tab:orange")
         
-        plt.title("Tuition Cost vs 6-Year Graduation Rate by College")
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("tuition_vs_6yr_graduation_dual.png")
+        # Margins before tight_layout, restored so each chart is laid out from the same start
+        params = fig.subplotpars
+        margins = {
+            "left": params.left, "right": params.right,
+            "bottom": params.bottom, "top": params.top,
+        }
+        return {"fig": fig, "ax1": ax1, "ax2": ax2, "bars": bars, "line": line, "margins": margins}
     
-    def plot_cohort_size_vs_4yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of cohort size vs 4-year graduation rate by college."""
-        if "cohort_size" not in self.df.columns:
-            self.df["cohort_size"] = self.df["application_volume"] * self.df["admission_rate"]
+    def _render_dual(self, spec: ChartSpec) -> None:
+        """Create a dual-axis plot with one metric as bars and another as a line by college."""
+        if self.large_mode:
+            self._render_binned_dual(spec)
+            return
+        # Figures are only kept for reuse inside a scope, where they are released on exit
+        key = tuple(self.df["colleges"])
+        layout = self._dual_layouts.get(key) if self._scope_depth else None
+        if layout is None:
+            layout = self._dual_layout()
+            if self._scope_depth:
+                self._dual_layouts[key] = layout
         
-        num_colleges = len(self.df)
-        figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
+        ax1, ax2 = layout["ax1"], layout["ax2"]
+        bar_label, bar_axis_label = METRIC_LABELS[spec.x]
+        line_label, line_axis_label = METRIC_LABELS[spec.y]
         
-        ax1.set_xlabel("College")
-        ax1.set_ylabel("Cohort Size", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["cohort_size"], color="tab:blue", alpha=0.7, label="Cohort Size")
-        ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+        ax1.set_ylabel(bar_axis_label, color="tab:blue")
+        for rect, height in zip(layout["bars"], self.df[spec.x]):
+            rect.set_height(height)
+        layout["bars"].set_label(bar_label)
+        ax1.relim()
+        ax1.autoscale_view()
         
-        ax2 = ax1.twinx()
-        ax2.set_ylabel("4-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_4yr"], color="tab:orange", marker="o", linewidth=2, label="4-Year Graduation Rate")
-        ax2.tick_params(axis="y", labelcolor="tab:orange")
+        ax2.set_ylabel(line_axis_label, color="tab:orange")
+        layout["line"].set_ydata(self.df[spec.y])
+        layout["line"].set_label(line_label)
+        ax2.relim()
+        ax2.autoscale_view()
         
-        plt.title("Cohort Size vs 4-Year Graduation Rate by College")
+        layout["fig"].subplots_adjust(**layout["margins"])
+        plt.figure(layout["fig"])
+        ax2.set_title(spec.title)
         lines1, labels1 = ax1.get_legend_handles_labels()
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("cohort_size_vs_4yr_graduation_dual.png")
+        self._save_figure(spec, release=not self._scope_depth)
     
-    def plot_cohort_size_vs_6yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of cohort size vs 6-year graduation rate by college."""
-        if "cohort_size" not in self.df.columns:
-            self.df["cohort_size"] = self.df["application_volume"] * self.df["admission_rate"]
+    def _render_binned_dual(self, spec: ChartSpec) -> None:
+        """
+        Create a dual-axis plot of both metrics averaged over quantile bins of the bar metric.
         
-        num_colleges = len(self.df)
-        figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
+        Used above the large-dataset threshold in place of one bar per college,
+        so the figure width and bar count stay fixed at DUAL_AXIS_BINS.
+        """
+        values = self.df[[spec.x, spec.y]].dropna()
+        bins = pd.qcut(values[spec.x], q=DUAL_AXIS_BINS, duplicates="drop")
+        grouped = values.groupby(bins, observed=True).agg(["mean", "size"])
+        bar_means = grouped[(spec.x, "mean")]
+        line_means = grouped[(spec.y, "mean")]
+        tick_labels = [f"{interval.left:,.0f}-{interval.right:,.0f}" for interval in grouped.index]
+        positions = range(len(grouped))
         
-        ax1.set_xlabel("College")
-        ax1.set_ylabel("Cohort Size", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["cohort_size"], color="tab:blue", alpha=0.7, label="Cohort Size")
+        bar_label, bar_axis_label = METRIC_LABELS[spec.x]
+        line_label, line_axis_label = METRIC_LABELS[spec.y]
+        fig, ax1 = self._create_subplots(figsize=(12, 6))
+        
+        ax1.set_xlabel(f"{bar_label} bin ({len(values):,} colleges, ~{len(values) // len(grouped):,} per bin)")
+        ax1.set_ylabel(f"Mean {bar_axis_label}", color="tab:blue")
+        ax1.bar(positions, bar_means, color="tab:blue", alpha=0.7, label=f"Mean {bar_label}")
         ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+        ax1.set_xticks(positions)
+        ax1.set_xticklabels(tick_labels, rotation=45, ha="right")
         
         ax2 = ax1.twinx()
-        ax2.set_ylabel("6-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_6yr"], color="tab:orange", marker="o", linewidth=2, label="6-Year Graduation Rate")
+        ax2.set_ylabel(f"Mean {line_axis_label}", color="tab:orange")
+        ax2.plot(positions, line_means, color="tab:orange", marker="o", linewidth=2, label=f"Mean {line_label}")
         ax2.tick_params(axis="y", labelcolor="tab:orange")
         
-        plt.title("Cohort Size vs 6-Year Graduation Rate by College")
+        ax2.set_title(spec.title)
         lines1, labels1 = ax1.get_legend_handles_labels()
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("cohort_size_vs_6yr_graduation_dual.png")
+        self._save_figure(spec)
     
-    def plot_application_volume_vs_4yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of application volume vs 4-year graduation rate by college."""
-        num_colleges = len(self.df)
-        figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
+    def _chart_cache_key(self, spec: ChartSpec, column_hashes: dict) -> str:
+        """
+        Build the cache key for a chart from its data, its spec and the rendering code.
         
-        ax1.set_xlabel("College")
-        ax1.set_ylabel("Application Volume", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["application_volume"], color="tab:blue", alpha=0.7, label="Application Volume")
-        ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+        Args:
+            spec (ChartSpec): Chart to build the key for
+            column_hashes (dict): Per-column content hashes, filled in as needed
         
-        ax2 = ax1.twinx()
-        ax2.set_ylabel("4-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_4yr"], color="tab:orange", marker="o", linewidth=2, label="4-Year Graduation Rate")
-        ax2.tick_params(axis="y", labelcolor="tab:orange")
+        Returns:
+            str: Cache key for the rendered chart; combine it with an export
+                target to get the key of one exported file
+        """
+        if spec.kind == "heatmap":
+            columns = list(self.df.select_dtypes(include='number').columns)
+        else:
+            columns = ["colleges", spec.x, spec.y]
+        for column in columns:
+            if column not in column_hashes:
+                column_hashes[column] = hash_dataframe(self.df[[column]])
+        return hash_values(
+            [column_hashes[column] for column in columns],
+            spec,
+            METRIC_LABELS,
+            (self.large_mode, TOP_K_COLLEGES, HEXBIN_GRIDSIZE, DUAL_AXIS_BINS, HEATMAP_ANNOTATION_LIMIT),
+            inspect.getsource(type(self)),
+            matplotlib.__version__,
+            sns.__version__,
+        )
+    
+    def _render_selected(self, chart_names: list, workers: int) -> None:
+        """
+        Render charts, serially or across a process pool.
         
-        plt.title("Application Volume vs 4-Year Graduation Rate by College")
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("application_volume_vs_4yr_graduation_dual.png")
+        Args:
+            chart_names (list): Names of the registered charts to render
+            workers (int): Number of worker processes to use
+        """
+        if workers <= 1:
+            with self:
+                for name in chart_names:
+                    self.render_chart(name)
+            return
+        
+        batches = [chart_names[i::workers] for i in range(workers)]
+        # Spans inside the worker processes are not collected; time the pool as a whole
+        with span("render_pool", workers=workers, charts=len(chart_names)):
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(self,)
+            ) as executor:
+                # list() re-raises the first error from any worker
+                list(executor.map(_render_charts, batches))
     
-    def plot_application_volume_vs_6yr_graduation_dual(self) -> None:
-        """Create a dual-axis plot of application volume vs 6-year graduation rate by college."""
-        num_colleges = len(self.df)
-        figsize = (max(10, num_colleges * 0.6), 6)
-        fig, ax1 = plt.subplots(figsize=figsize)
+    def create_all_visualizations(
+        self,
+        workers: int | None = 1,
+        cache: PipelineCache | None = None
+    ) -> None:
+        """
+        Render every registered chart, serially or across a process pool.
         
-        ax1.set_xlabel("College")
-        ax1.set_ylabel("Application Volume", color="tab:blue")
-        ax1.bar(self.df["colleges"], self.df["application_volume"], color="tab:blue", alpha=0.7, label="Application Volume")
-        ax1.tick_params(axis="y", labelcolor="tab:blue")
-        ax1.set_xticks(range(len(self.df["colleges"])))
-        ax1.set_xticklabels(self.df["colleges"], rotation=45, ha="right")
+        With more than one worker, the charts are split across processes that
+        use the non-interactive Agg backend. Every chart writes a fixed file
+        name per export target, so the output files are the same as the
+        serial path.
         
-        ax2 = ax1.twinx()
-        ax2.set_ylabel("6-Year Graduation Rate (%)", color="tab:orange")
-        ax2.plot(self.df["colleges"], self.df["graduate_rate_6yr"], color="tab:orange", marker="o", linewidth=2, label="6-Year Graduation Rate")
-        ax2.tick_params(axis="y", labelcolor="tab:orange")
+        Args:
+            workers (int | None): Number of worker processes to use; 1 renders
+                in this process, None uses one worker per CPU
+            cache (PipelineCache | None): Cache of rendered figures; charts whose
+                data, spec and rendering code are unchanged are copied from it
+                instead of being rendered
+        """
+        chart_names = list(self.chart_specs)
+        cache_keys = {}
+        if cache is not None:
+            column_hashes = {}
+            for name in list(chart_names):
+                spec = self.chart_specs[name]
+                chart_key = self._chart_cache_key(spec, column_hashes)
+                cache_keys[name] = {target: hash_values(chart_key, target) for target in self.exports}
+                cached_paths = {
+                    target: cache.get(key, f".{target.format}")
+                    for target, key in cache_keys[name].items()
+                }
+                # A chart is only skipped when every one of its exports is cached
+                if all(path is not None for path in cached_paths.values()):
+                    for target, cached_path in cached_paths.items():
+                        path = self.export_path(spec, target)
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        shutil.copyfile(cached_path, path)
+                    chart_names.remove(name)
         
-        plt.title("Application Volume vs 6-Year Graduation Rate by College")
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-        self._save_figure("application_volume_vs_6yr_graduation_dual.png")
-    
-    def create_all_visualizations(self) -> None:
-        """Execute all visualization steps in sequence."""
-        self.plot_admission_rate_vs_6yr_graduation()
-        self.plot_selectivity_score_vs_4yr_graduation()
-        self.plot_selectivity_score_vs_6yr_graduation()
-        self.plot_admission_rate_vs_4yr_graduation()
-        self.plot_tuition_vs_4yr_graduation_dual()
-        self.plot_tuition_vs_6yr_graduation_dual()
-        self.plot_cohort_size_vs_4yr_graduation_dual()
-        self.plot_cohort_size_vs_6yr_graduation_dual()
-        self.plot_application_volume_vs_4yr_graduation_dual()
-        self.plot_application_volume_vs_6yr_graduation_dual()
-        self.plot_correlation_heatmap()
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(chart_names))
+        if chart_names:
+            self._render_selected(chart_names, workers)
+        
+        if cache is not None:
+            for name in chart_names:
+                for target, key in cache_keys[name].items():
+                    cache.put(key, f".{target.format}", self.export_path(self.chart_specs[name], target))
     
     def get_dataframe(self) -> pd.DataFrame:
         """Return the current dataframe."""
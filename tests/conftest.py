@@ -0,0 +1,13 @@
+import os
+import sys
+
+import matplotlib
+
+# Tests import the modules in src/ the same way the scripts do
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# Datasets shipped with the repository
+DATASETS_DIR = os.path.join(os.path.dirname(SRC_DIR), "datasets")
+
+matplotlib.use("Agg")
@@ -0,0 +1,21 @@
+import os
+
+from analytics import CohortAnalyzer
+from conftest import DATASETS_DIR
+from data_io import read_dataset
+
+def test_summary_and_rank_table_share_band_order():
+    """Tuition bands come out in band order, not alphabetically, in both tables."""
+    df = read_dataset(os.path.join(DATASETS_DIR, "dataset.csv"))
+    df.loc[0, "tuition_cost"] = 15_000
+    # A non-default index must not misalign rows with their groups
+    df.index = df.index * 10 + 5
+    analyzer = CohortAnalyzer(df)
+    
+    summary = analyzer.summarize("tuition_band")
+    means = summary[(summary["metric"] == "graduate_rate_4yr") & (summary["statistic"] == "mean")]
+    ranks = analyzer.rank_table("tuition_band", "graduate_rate_4yr")
+    
+    assert list(means["group"]) == list(ranks["group"].unique())
+    assert means["group"].iloc[0] == "Under $20k"
+    assert means["value"].iloc[0] == df.loc[5, "graduate_rate_4yr"]
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from batch_runner import output_dirs_for
+
+@pytest.mark.parametrize("paths", [
+    ["data/ny.csv", "data/ny.parquet"],
+    ["a/ny.csv", "b/ny.csv", "a/ny.parquet"],
+    ["a/data/ny.csv", "b/data/ny.csv"],
+    ["ny.csv", "./ny.csv"],
+    ["data_ny.csv", "data/ny.csv", "data_ny_csv.csv"],
+])
+def test_every_dataset_gets_its_own_output_dir(paths):
+    """Datasets never share an output directory, however their names collide."""
+    output_dirs = output_dirs_for(paths, "out")
+    
+    assert len(set(output_dirs.values())) == len(paths)
+    assert all(os.path.dirname(path) == "out" for path in output_dirs.values())
+
+def test_distinct_stems_keep_plain_names():
+    """Names that do not collide stay as the file stem."""
+    output_dirs = output_dirs_for(["datasets/dataset.csv", "datasets/colleges_100.csv"], "out")
+    
+    assert output_dirs == {
+        "datasets/dataset.csv": os.path.join("out", "dataset"),
+        "datasets/colleges_100.csv": os.path.join("out", "colleges_100"),
+    }
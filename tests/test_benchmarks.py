@@ -0,0 +1,15 @@
+from benchmarks import compare_to_baseline
+
+def _results(**seconds) -> dict:
+    """Benchmark results for 12 rows with the given seconds per stage."""
+    return {"results": [{"rows": 12, "stage": stage, "seconds": value} for stage, value in seconds.items()]}
+
+def test_only_slowdowns_that_are_large_in_both_ratio_and_time_regress():
+    """A millisecond stage twice as slow is noise; a slow stage 50% slower is a regression."""
+    baseline = _results(load=0.004, charts=2.0, save=1.0)
+    current = _results(load=0.008, charts=3.0, save=1.1)
+    
+    regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+    
+    assert [regression["stage"] for regression in regressions] == ["charts"]
+    assert compare_to_baseline(current, baseline, tolerance=0.2, min_seconds=0)[0]["stage"] == "load"
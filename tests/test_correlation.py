@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlation import CorrelationEngine
+
+def _dataset(missing: bool) -> pd.DataFrame:
+    """Correlated, independent, constant and (optionally) sparse columns."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(300, 4)), columns=["a", "b", "c", "d"])
+    df["b"] = df["a"] * 0.6 + rng.normal(size=300)
+    df["d"] = -df["a"] + rng.normal(scale=0.1, size=300)
+    df["constant"] = 3.0
+    if missing:
+        df.loc[rng.random(300) < 0.3, "b"] = np.nan
+        # Few values left, so ranking over the whole column would differ from pandas
+        df.loc[rng.random(300) < 0.95, "c"] = np.nan
+        df.loc[rng.random(300) < 0.5, "constant"] = np.nan
+    return df
+
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_matrix_matches_pandas(method, missing):
+    """Both methods match DataFrame.corr, with pairwise missing values and constant columns giving NaN."""
+    df = _dataset(missing)
+    
+    result = CorrelationEngine(df).matrix(method)
+    expected = df.corr(method=method, min_periods=2)
+    
+    pd.testing.assert_frame_equal(result.astype("float64"), expected, atol=1e-5, rtol=0)
+
+def test_top_pairs_ranks_by_absolute_correlation():
+    """The strongest pair comes first even when it is negative, and signed ranking puts positives first."""
+    engine = CorrelationEngine(_dataset(missing=True))
+    
+    top = engine.top_pairs(k=2)
+    assert list(top[["column_a", "column_b"]].iloc[0]) == ["a", "d"]
+    assert top["correlation"].iloc[0] < -0.9
+    assert list(engine.top_pairs(k=1, absolute=False)[["column_a", "column_b"]].iloc[0]) == ["a", "b"]
+    assert len(engine.top_pairs(k=100)) == 10
+
+def test_clustered_order_puts_correlated_columns_together():
+    """Strongly correlated columns end up next to each other."""
+    engine = CorrelationEngine(_dataset(missing=False))
+    
+    order = engine.clustered_order()
+    assert sorted(order) == sorted(engine.columns)
+    assert abs(order.index("a") - order.index("d")) == 1
+    assert list(engine.clustered_matrix().columns) == order
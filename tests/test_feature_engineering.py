@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATASETS_DIR
+from feature_engineering_class import FeatureEngineer, FeatureSpec
+from pipeline_cache import PipelineCache
+
+COLLEGES_100 = os.path.join(DATASETS_DIR, "colleges_100.csv")
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1000])
+def test_chunked_output_matches_in_memory_output(tmp_path, chunksize):
+    """Engineering colleges_100.csv in chunks writes the same file as engineering it in memory."""
+    in_memory_path = tmp_path / "in_memory.csv"
+    chunked_path = tmp_path / "chunked.csv"
+    engineer = FeatureEngineer(COLLEGES_100)
+    engineer.engineer_all_features()
+    engineer.save_engineered_data(str(in_memory_path))
+    
+    rows = FeatureEngineer.engineer_in_chunks(COLLEGES_100, str(chunked_path), chunksize=chunksize)
+    
+    assert rows == len(engineer.df)
+    assert chunked_path.read_bytes() == in_memory_path.read_bytes()
+
+def test_chunked_mode_rejects_other_formats(tmp_path):
+    """Chunked mode only streams CSV, so other formats fail before anything is written."""
+    output_path = tmp_path / "engineered.parquet"
+    with pytest.raises(ValueError):
+        FeatureEngineer.engineer_in_chunks(COLLEGES_100, str(output_path))
+    assert not output_path.exists()
+
+def test_incremental_after_empty_output_matches_full_run(tmp_path):
+    """An engineered file with a header but no rows is treated as missing, and reruns keep the compact dtypes."""
+    engineered_path = tmp_path / "engineered.csv"
+    full = FeatureEngineer(COLLEGES_100)
+    full.engineer_all_features()
+    full.df.head(0).to_csv(engineered_path, index=False)
+    
+    first = FeatureEngineer(COLLEGES_100)
+    assert first.engineer_incremental(str(engineered_path)) == len(full.df)
+    rerun = FeatureEngineer(COLLEGES_100)
+    assert rerun.engineer_incremental(str(engineered_path)) == 0
+    pd.testing.assert_frame_equal(rerun.df, full.df)
+
+def _scaled_by(scale: int):
+    """Build a compute function whose constant lives in a closure."""
+    return lambda tuition: tuition / scale
+
+@pytest.mark.parametrize("first, second", [
+    (lambda tuition: tuition / 1000, lambda tuition: tuition / 100),
+    (_scaled_by(1000), _scaled_by(100)),
+])
+def test_feature_cache_misses_when_compute_constants_change(tmp_path, first, second):
+    """Changing only a constant in a registered feature recomputes it instead of serving the cached result."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    results = []
+    for compute in (first, second):
+        engineer = FeatureEngineer(COLLEGES_100)
+        engineer.register_feature(FeatureSpec("tuition_k", ("tuition_cost",), compute))
+        engineer.engineer_all_features(cache=cache)
+        results.append(engineer.df["tuition_k"].iloc[0])
+    
+    assert results[1] == pytest.approx(results[0] * 10)
+
+def test_integer_products_do_not_overflow_compact_dtypes():
+    """Features multiplying int32-stored columns are computed in 64 bits."""
+    engineer = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    engineer.register_feature(FeatureSpec("gross", ("application_volume", "tuition_cost"), lambda a, t: a * t))
+    engineer.compute_features(["gross"])
+    
+    df = engineer.df
+    expected = df["application_volume"].astype("int64") * df["tuition_cost"].astype("int64")
+    assert str(df["application_volume"].dtype) == "int32"
+    assert (df["gross"] == expected).all()
+    assert df["gross"].max() > np.iinfo("int32").max
+
+def test_incremental_after_filling_a_missing_value(tmp_path):
+    """A value missing from the saved output but now filled in marks only that row as changed."""
+    engineered_path = tmp_path / "engineered.csv"
+    df = pd.read_csv(os.path.join(DATASETS_DIR, "dataset.csv"), thousands=",")
+    blanked = df.astype({"application_volume": "float64"})
+    blanked.loc[2, "application_volume"] = np.nan
+    FeatureEngineer(blanked, validate=False).engineer_incremental(str(engineered_path))
+    
+    # The fixed file loads application_volume as int32, the saved output has it as float with NaN
+    rerun = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    assert rerun.engineer_incremental(str(engineered_path)) == 1
+    full = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    full.engineer_all_features()
+    pd.testing.assert_frame_equal(rerun.df, full.df)
@@ -0,0 +1,27 @@
+from instrumentation import disable_tracing, enable_tracing, span
+
+MB = 1_000_000
+
+def test_peak_counts_memory_freed_inside_nested_spans():
+    """A buffer freed inside a step shows in its peak, and in every enclosing step's peak."""
+    enable_tracing()
+    try:
+        with span("outer"):
+            kept = bytearray(5 * MB)
+            with span("inner"):
+                scratch = bytearray(20 * MB)
+                del scratch
+            with span("empty"):
+                pass
+            scratch = bytearray(8 * MB)
+            del scratch
+    finally:
+        tracer = disable_tracing()
+    events = {event["name"]: event for event in tracer.events}
+    
+    assert 20 * MB <= events["inner"]["peak_bytes"] < 21 * MB
+    assert events["inner"]["net_bytes"] < MB
+    assert events["empty"]["peak_bytes"] < MB
+    assert 25 * MB <= events["outer"]["peak_bytes"] < 26 * MB
+    assert 5 * MB <= events["outer"]["net_bytes"] < 6 * MB
+    del kept
@@ -0,0 +1,33 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATASETS_DIR
+from feature_engineering_class import FeatureEngineer
+from peers import PeerIndex
+
+@pytest.fixture
+def two_years():
+    """dataset.csv repeated for two years, with tuition raised in the second."""
+    engineer = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    engineer.engineer_all_features()
+    df = engineer.get_dataframe()
+    return pd.concat([
+        df.assign(year=2022),
+        df.assign(year=2023, tuition_cost=df["tuition_cost"] + 1000),
+    ], ignore_index=True)
+
+def test_repeated_names_need_a_period(two_years):
+    """Multi-year data without a period fails with a clear error instead of a pandas reindexing error."""
+    with pytest.raises(ValueError, match="pass a period"):
+        PeerIndex(two_years)
+
+def test_period_selects_one_row_per_college(two_years):
+    """Choosing a period indexes each college once, and periods given as text match numeric years."""
+    index = PeerIndex(two_years, period="2023")
+    
+    assert len(index) == two_years["colleges"].nunique()
+    peers = index.peers("harvard", k=3)
+    assert list(peers["rank"]) == [1, 2, 3]
+    assert "harvard" not in set(peers["peer"])
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from conftest import DATASETS_DIR
+from feature_engineering_class import FeatureEngineer
+from pipeline_cache import PipelineCache
+from visualization_class import CollegeVisualizer
+
+def _put(cache: PipelineCache, tmp_path, key: str, size: int, used_at: float) -> str:
+    """Store a file of the given size and set when it was last used."""
+    source = tmp_path / f"{key}.bin"
+    source.write_bytes(b"x" * size)
+    path = cache.put(key, ".bin", str(source))
+    os.utime(path, (used_at, used_at))
+    return path
+
+def test_eviction_keeps_the_newest_entry_within_max_bytes(tmp_path):
+    """Least recently used entries go first, and the entry just stored stays even if it alone is too big."""
+    cache = PipelineCache(str(tmp_path / "cache"), max_bytes=250)
+    first = _put(cache, tmp_path, "first", 100, 1_000)
+    second = _put(cache, tmp_path, "second", 100, 2_000)
+    assert cache.get("first", ".bin") == first
+    os.utime(first, (3_000, 3_000))
+    
+    third = _put(cache, tmp_path, "third", 100, 4_000)
+    assert not os.path.exists(second)
+    assert os.path.exists(first) and os.path.exists(third)
+    assert cache.size() <= cache.max_bytes
+    
+    huge = _put(cache, tmp_path, "huge", 1_000, 5_000)
+    assert os.listdir(cache.cache_dir) == [os.path.basename(huge)]
+
+def test_invalidate_removes_entries(tmp_path):
+    """invalidate(key) removes that key's entries and invalidate() clears the rest."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    for key in ("alpha", "beta", "gamma"):
+        _put(cache, tmp_path, key, 10, 1_000)
+    
+    assert cache.invalidate("beta") == 1
+    assert cache.get("beta", ".bin") is None
+    assert cache.invalidate() == 2
+    assert cache.size() == 0
+
+@pytest.fixture
+def rendered_charts(monkeypatch):
+    """Record the chart names every visualizer actually renders."""
+    rendered = []
+    render_selected = CollegeVisualizer._render_selected
+    
+    def record(self, chart_names, workers):
+        rendered.append(list(chart_names))
+        render_selected(self, chart_names, workers)
+    
+    monkeypatch.setattr(CollegeVisualizer, "_render_selected", record)
+    return rendered
+
+def test_figure_cache_renders_only_changed_charts(tmp_path, rendered_charts):
+    """A repeat run renders nothing, and changing one column re-renders only the charts that use it."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    engineer = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    engineer.engineer_all_features()
+    
+    def run(df, output_dir):
+        visualizer = CollegeVisualizer(df, output_dir=str(tmp_path / output_dir), exports=("preview",))
+        visualizer.create_all_visualizations(cache=cache)
+        return visualizer
+    
+    visualizer = run(engineer.df, "first")
+    assert rendered_charts == [list(visualizer.chart_specs)]
+    
+    run(engineer.df, "second")
+    assert len(rendered_charts) == 1
+    assert sorted(os.listdir(tmp_path / "second" / "preview")) == sorted(os.listdir(tmp_path / "first" / "preview"))
+    
+    changed = engineer.df.copy()
+    changed.loc[0, "tuition_cost"] += 1_000
+    run(changed, "third")
+    assert sorted(rendered_charts[1]) == sorted(
+        name for name, spec in visualizer.chart_specs.items()
+        if spec.kind == "heatmap" or "tuition_cost" in (spec.x, spec.y)
+    )
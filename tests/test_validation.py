@@ -0,0 +1,35 @@
+import os
+
+import pandas as pd
+
+from conftest import DATASETS_DIR
+from data_io import read_dataset
+from schema import normalize_columns
+from validation import validate_dataset
+
+COLLEGE_DATA = os.path.join(DATASETS_DIR, "college_data.csv")
+
+def test_unrecognised_columns_are_reported_as_missing():
+    """A variant export read without normalizing its names is not reported as clean."""
+    report = validate_dataset(read_dataset(COLLEGE_DATA))
+    
+    missing = report[report["check"] == "missing_column"]
+    assert set(missing["column"]) == {
+        "colleges", "admission_rate", "graduate_rate_4yr", "graduate_rate_6yr",
+        "application_volume", "tuition_cost",
+    }
+    assert missing["row"].isna().all()
+
+def test_normalized_variant_export_is_clean():
+    """Once its names are normalized, college_data.csv passes every check."""
+    assert validate_dataset(normalize_columns(read_dataset(COLLEGE_DATA))).empty
+
+def test_missing_columns_come_before_row_problems():
+    """Missing columns lead the report, followed by row problems in row order."""
+    df = pd.DataFrame({"colleges": ["a", "a"], "admission_rate": [0.5, 1.5]})
+    report = validate_dataset(df)
+    
+    assert list(report["check"][:4]) == ["missing_column"] * 4
+    assert list(zip(report["row"][4:], report["check"][4:])) == [
+        (0, "duplicate"), (1, "out_of_range"), (1, "duplicate"),
+    ]
@@ -0,0 +1,44 @@
+import os
+import resource
+
+import matplotlib.pyplot as plt
+
+from conftest import DATASETS_DIR
+from feature_engineering_class import FeatureEngineer
+from visualization_class import CollegeVisualizer
+
+# Repeated runs may grow peak RSS by at most this many kilobytes after the first run
+RSS_GROWTH_LIMIT_KB = 50_000
+
+def _peak_rss_kb() -> int:
+    """Return the peak resident set size of this process in kilobytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def test_repeated_runs_leave_no_figures_open_and_memory_flat(tmp_path):
+    """Every figure is closed after saving, so repeated runs neither leak figures nor grow memory."""
+    engineer = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    engineer.engineer_all_features()
+    visualizer = CollegeVisualizer(engineer, output_dir=str(tmp_path), exports=("preview",))
+    
+    # The first run loads fonts and builds caches, so growth is measured after it
+    visualizer.create_all_visualizations()
+    assert plt.get_fignums() == []
+    baseline = _peak_rss_kb()
+    
+    for _ in range(2):
+        visualizer.create_all_visualizations()
+        assert plt.get_fignums() == []
+    assert _peak_rss_kb() - baseline < RSS_GROWTH_LIMIT_KB
+    assert len(os.listdir(tmp_path / "preview")) == len(visualizer.chart_specs)
+
+def test_row_slice_only_lists_its_own_colleges(tmp_path):
+    """A slice of an engineered frame plots only its colleges; a whole frame is still used in place."""
+    engineer = FeatureEngineer(os.path.join(DATASETS_DIR, "dataset.csv"))
+    engineer.engineer_all_features()
+    sliced = engineer.df.iloc[:3]
+    
+    visualizer = CollegeVisualizer(sliced, output_dir=str(tmp_path), exports=("preview",))
+    
+    assert list(visualizer.df["colleges"].cat.categories) == list(sliced["colleges"])
+    assert len(engineer.df["colleges"].cat.categories) == len(engineer.df)
+    assert CollegeVisualizer(engineer, output_dir=str(tmp_path)).df is engineer.df